@@ -1,15 +1,54 @@
 import os
-from datetime import datetime
-from typing import Callable, Optional
+import select
+import sys
+import threading
+import time
+from datetime import timedelta
+from functools import partial
+from typing import Callable, Dict, Optional
 
 BTN1 = 17
 BTN2 = 27
 BTN3 = 22
 
+# Physical layout (left-to-right): back, refresh, next
+DEFAULT_EVENT_MAP: Dict[int, str] = {BTN1: "back", BTN2: "refresh", BTN3: "next"}
+
+# Character device used for edge-event button handling (libgpiod v2 bindings).
+GPIO_CHIP = os.environ.get("DISPLAY_GPIO_CHIP", "/dev/gpiochip0")
+# Presses closer together than this are treated as contact bounce.
+DEBOUNCE_NS = 50_000_000
+DEBOUNCE_PERIOD = timedelta(microseconds=DEBOUNCE_NS // 1000)
+
+# Formatted timestamp of the last logged second; bounce storms and repeated
+# presses within the same second reuse it instead of re-running strftime.
+_LAST_SEC = -1
+_LAST_STR = ""
+_PREFIX = "[BUTTONS] ["
+
 
 def log(msg: str) -> None:
-    t = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[BUTTONS] [{t}] {msg}", flush=True)
+    global _LAST_SEC, _LAST_STR
+    sec = int(time.time())
+    if sec != _LAST_SEC:
+        _LAST_STR = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        _LAST_SEC = sec
+    # One write per line; flushed right away because under systemd stdout is a
+    # pipe and would otherwise hold button logs back from the journal.
+    sys.stdout.write("".join((_PREFIX, _LAST_STR, "] ", msg, "\n")))
+    sys.stdout.flush()
+
+
+def _import_gpiod():
+    try:
+        import gpiod  # type: ignore
+
+        if not hasattr(gpiod, "request_lines"):
+            log("gpiod bindings are older than v2. Using gpiozero instead.")
+            return None
+        return gpiod
+    except Exception:  # pragma: no cover - optional dependency
+        return None
 
 
 def _import_button():
@@ -26,37 +65,141 @@ def _import_button():
 _BUTTONS = []
 
 
+def _dispatch(on_event: Optional[Callable[[str], None]], event: str) -> None:
+    log(f"Button event: {event}")
+    if on_event:
+        on_event(event)
+
+
+def _edge_loop(
+    request,
+    events: Dict[int, str],
+    dispatch: Callable[[str], None],
+    soft_debounce: bool = False,
+    fallback: Optional[Callable[[], bool]] = None,
+) -> None:
+    """Block in epoll until the kernel reports a falling edge, then dispatch it.
+
+    With ``soft_debounce`` off the kernel has already filtered contact bounce.
+    If reading the line request fails, it is released and ``fallback`` (the
+    gpiozero path) takes over.
+    """
+    last_ns: Dict[int, int] = {}
+
+    try:
+        poller = select.epoll()
+        poller.register(request.fd, select.EPOLLIN | select.EPOLLET)
+        while True:
+            poller.poll()
+            # Edge-triggered: drain every queued event before polling again.
+            while request.wait_edge_events(0):
+                for edge in request.read_edge_events():
+                    pin = edge.line_offset
+                    if soft_debounce:
+                        if edge.timestamp_ns - last_ns.get(pin, 0) < DEBOUNCE_NS:
+                            continue
+                        last_ns[pin] = edge.timestamp_ns
+                    event = events.get(pin)
+                    if event:
+                        try:
+                            dispatch(event)
+                        except Exception as exc:
+                            # A failing handler must not take the button thread down.
+                            log(f"Button handler failed for {event}: {exc}")
+    except Exception as exc:
+        log(f"Edge event loop failed ({exc}). Using gpiozero instead.")
+
+    try:
+        request.release()
+    except Exception:
+        pass
+    if fallback is not None:
+        fallback()
+
+
+def _init_edge_buttons(
+    events: Dict[int, str],
+    dispatch: Callable[[str], None],
+    fallback: Optional[Callable[[], bool]] = None,
+) -> bool:
+    gpiod = _import_gpiod()
+    if gpiod is None:
+        return False
+
+    from gpiod.line import Bias, Edge  # type: ignore
+
+    def request_lines(**debounce):
+        settings = gpiod.LineSettings(edge_detection=Edge.FALLING, bias=Bias.PULL_UP, **debounce)
+        return gpiod.request_lines(GPIO_CHIP, consumer="dumb-smart-display", config={tuple(events): settings})
+
+    soft_debounce = False
+    try:
+        # Let the kernel drop bounces before the event fd ever becomes readable.
+        request = request_lines(debounce_period=DEBOUNCE_PERIOD)
+    except Exception as exc:
+        log(f"Kernel debounce unavailable ({exc}). Debouncing in software.")
+        soft_debounce = True
+        try:
+            request = request_lines()
+        except Exception as exc:
+            log(f"Edge events unavailable on {GPIO_CHIP} ({exc}). Using gpiozero instead.")
+            return False
+
+    thread = threading.Thread(
+        target=_edge_loop,
+        args=(request, events, dispatch, soft_debounce, fallback),
+        name="buttons",
+        daemon=True,
+    )
+    thread.start()
+
+    global _BUTTONS
+    _BUTTONS = [request]
+    return True
+
+
+def _init_gpiozero_buttons(events: Dict[int, str], on_event: Optional[Callable[[str], None]]) -> bool:
+    Button = _import_button()
+    if Button is None:
+        return False
+
+    buttons = []
+    for pin, event in events.items():
+        button = Button(pin, pull_up=True, bounce_time=0.05)
+        # partial binds the event name eagerly (no late-binding lambda gotcha).
+        button.when_pressed = partial(_dispatch, on_event, event)
+        buttons.append(button)
+
+    # Store references to prevent garbage collection, which would drop callbacks
+    global _BUTTONS
+    _BUTTONS = buttons
+
+    log("Buttons initialized.")
+    return True
+
+
 def init_buttons(
     display: Optional[object] = None,
     simulate: bool = False,
     on_event: Optional[Callable[[str], None]] = None,
+    event_map: Optional[Dict[int, str]] = None,
 ) -> None:
+    """Wire GPIO buttons to ``on_event``.
+
+    ``event_map`` maps BCM pin numbers to logical event names and defaults to
+    ``DEFAULT_EVENT_MAP``.
+    """
     simulate = simulate or os.environ.get("DISPLAY_SIMULATE", "").lower() in {"1", "true", "yes"}
 
     if simulate:
         log("Simulation enabled: skipping hardware button setup.")
         return
 
-    Button = _import_button()
-    if Button is None:
-        return
-
-    b1 = Button(BTN1, pull_up=True, bounce_time=0.05)
-    b2 = Button(BTN2, pull_up=True, bounce_time=0.05)
-    b3 = Button(BTN3, pull_up=True, bounce_time=0.05)
-
-    def _dispatch(event: str) -> None:
-        log(f"Button event: {event}")
-        if on_event:
-            on_event(event)
+    events = dict(event_map or DEFAULT_EVENT_MAP)
+    fallback = partial(_init_gpiozero_buttons, events, on_event)
 
-    # Physical layout (left-to-right): back, refresh, next
-    b1.when_pressed = lambda: _dispatch("back")
-    b2.when_pressed = lambda: _dispatch("refresh")
-    b3.when_pressed = lambda: _dispatch("next")
-
-    # Store references to prevent garbage collection, which would drop callbacks
-    global _BUTTONS
-    _BUTTONS = [b1, b2, b3]
+    if _init_edge_buttons(events, partial(_dispatch, on_event), fallback):
+        log(f"Buttons initialized (edge events on {GPIO_CHIP}).")
+        return
 
-    log("Buttons initialized.")
+    fallback()
@@ -15,6 +15,16 @@ Required hooks
 - ``handle_button(event)`` -> ``None``: react to logical button events such as
   ``"prev"``, ``"next"``, or ``"action"``.
 
+Threading
+=========
+
+``render``, ``tick``, ``force_refresh`` and ``handle_button`` are called from
+different threads (render worker, main loop, button handler). The manager
+serializes these calls per module instance, so state they share needs no
+extra locking. Threads a module starts itself must publish their results
+atomically (e.g. by swapping in a new object), since they run alongside
+``render``.
+
 Optional hooks
 ==============
 
@@ -35,16 +45,25 @@ simple grid made up of ``columns`` and ``rows`` counts. ``LayoutSlot`` entries
 describe the position of one logical section by defining how many columns and
 rows it spans. The presets map to the sample layouts shown in the reference
 image used during planning.
+
+Each preset also precomputes ``slot_rects``: the placed rectangle of every
+slot as fractions of the canvas, using row-major first-fit placement. Use
+``LayoutPreset.slot_boxes(width, height)`` to scale them to pixels.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Optional, Protocol, Sequence, Tuple, runtime_checkable
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
 
 from PIL import Image
 
+# Presets are immutable and long-lived; __slots__ drops the per-instance
+# __dict__ where the interpreter supports it (3.10+).
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class LayoutSlot:
     """A logical slot inside a layout grid.
 
@@ -58,7 +77,7 @@ class LayoutSlot:
     rowspan: int = 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class LayoutPreset:
     """Declarative layout option a module can implement.
 
@@ -73,6 +92,68 @@ class LayoutPreset:
     slots: Tuple[LayoutSlot, ...]
     description: str
     compact: bool = False
+    slot_rects: Tuple[Tuple[str, Tuple[float, float, float, float]], ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # One int bitmask of occupied columns per grid row.
+        occupied = [0] * self.rows
+        rects: List[Tuple[str, Tuple[float, float, float, float]]] = []
+
+        for slot in self.slots:
+            start = _first_fit(self.columns, self.rows, slot.colspan, slot.rowspan, occupied)
+            if start is None:
+                continue
+            col, row = start
+            rects.append(
+                (
+                    slot.key,
+                    (
+                        col / self.columns,
+                        row / self.rows,
+                        (col + slot.colspan) / self.columns,
+                        (row + slot.rowspan) / self.rows,
+                    ),
+                )
+            )
+
+        object.__setattr__(self, "slot_rects", tuple(rects))
+
+    def slot_boxes(self, width: int, height: int) -> Dict[str, Tuple[int, int, int, int]]:
+        """Return pixel boxes ``(x0, y0, x1, y1)`` for each placed slot."""
+        return {
+            key: (
+                int(round(x0 * width)),
+                int(round(y0 * height)),
+                int(round(x1 * width)),
+                int(round(y1 * height)),
+            )
+            for key, (x0, y0, x1, y1) in self.slot_rects
+        }
+
+
+def _first_fit(
+    columns: int, rows: int, colspan: int, rowspan: int, occupied: List[int]
+) -> Optional[Tuple[int, int]]:
+    """Place a span at the first free row-major cell, marking it occupied.
+
+    ``occupied`` holds one bitmask per row (bit ``c`` set = column ``c`` taken).
+    """
+    need = (1 << colspan) - 1
+    for row in range(rows - rowspan + 1):
+        span = range(row, row + rowspan)
+        taken = 0
+        for r in span:
+            taken |= occupied[r]
+        for col in range(columns - colspan + 1):
+            mask = need << col
+            if taken & mask:
+                continue
+            for r in span:
+                occupied[r] |= mask
+            return col, row
+    return None
 
 
 # Layout presets matching the visual examples in the design reference.
@@ -161,8 +242,13 @@ DEFAULT_LAYOUTS: Tuple[LayoutPreset, ...] = (
 )
 
 
-@runtime_checkable
 class DisplayModule(Protocol):
+    """Static-typing contract only.
+
+    Not ``runtime_checkable``: ``ModuleManager`` checks the required hooks once
+    at load time and never ``isinstance``-checks modules afterwards.
+    """
+
     name: str
 
     def __init__(self, config: Dict[str, Any], fonts: Dict[str, Any]) -> None:
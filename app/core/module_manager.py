@@ -4,11 +4,19 @@ from __future__ import annotations
 import importlib
 import inspect
 import pkgutil
+import sys
+import threading
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from app.core.module_interface import DisplayModule
 
+_DEFAULT_MODULES_PATH = Path(__file__).resolve().parent.parent / "modules"
+_REQUIRED_HOOKS = ("render", "tick")
+# Shared config for modules without a config section; modules only read it.
+_EMPTY_CFG: Dict[str, Any] = {}
+
 
 class ModuleManager:
     """Discover, load, and coordinate display modules."""
@@ -23,98 +31,259 @@ class ModuleManager:
     ) -> None:
         self.fonts = fonts
         self.modules_package = modules_package
-        self.modules_path = modules_path or Path(__file__).resolve().parent.parent / "modules"
+        self.modules_path = modules_path or _DEFAULT_MODULES_PATH
         self.enabled_modules = enabled_modules
         self.module_config = module_config or {}
-        self.modules: List[DisplayModule] = []
-        self._active_index: Optional[int] = None
+        # Modules are constructed lazily so boot does not wait on every
+        # constructor: the active one on first use, and the next one in rotation
+        # on each background tick so it is already fetching before it is shown.
+        # The slot lists below, the module count and the active index are
+        # guarded by _instantiate_lock: buttons, rendering and ticks reach them
+        # from different threads. Constructors run outside the lock.
+        self._names: List[str] = []
+        self._factories: List[Callable[[], DisplayModule]] = []
+        self._instances: List[Optional[DisplayModule]] = []
+        # Per-module (refresh, handle_button) callables resolved once per instance.
+        self._hooks: List[Optional[Tuple[Callable[[], None], Optional[Callable[[str], None]]]]] = []
+        self._instantiate_lock = threading.Lock()
+        # Signalled whenever a slot is filled or dropped.
+        self._built = threading.Condition(self._instantiate_lock)
+        # Factories currently being run by some thread.
+        self._building: Set[Callable[[], DisplayModule]] = set()
+        self._pending = 0
+        self._n_modules = 0
+        self._tick_callables: List[Tuple[DisplayModule, Callable[[], None], threading.RLock]] = []
+        # One lock per instance (keyed by id) serializing render/tick/refresh/
+        # button calls into it; see module_interface "Threading".
+        self._call_locks: Dict[int, threading.RLock] = {}
+        self._active_index = 0
+        self._discover_cache: Optional[Tuple[str, ...]] = None
+        self._discover_mtime = 0
 
     # ------------------------------------------------------------------
     # Module discovery & loading
     # ------------------------------------------------------------------
-    def discover_available_modules(self) -> List[str]:
-        """Return all module names available in app.modules."""
-        names: List[str] = []
-        if not self.modules_path.exists():
-            return names
+    def discover_available_modules(self) -> Tuple[str, ...]:
+        """Return all module names available in app.modules.
+
+        The result is cached until the modules directory's mtime changes.
+        """
+        try:
+            mtime = self.modules_path.stat().st_mtime_ns
+        except OSError:
+            return ()
+
+        if self._discover_cache is not None and mtime == self._discover_mtime:
+            return self._discover_cache
 
+        names: List[str] = []
         for module_info in pkgutil.iter_modules([str(self.modules_path)]):
             if module_info.name.startswith("__"):
                 continue
             names.append(module_info.name)
-        return names
+
+        self._discover_cache = tuple(names)
+        self._discover_mtime = mtime
+        return self._discover_cache
+
+    @property
+    def modules(self) -> List[DisplayModule]:
+        """Modules that have been instantiated so far, in navigation order."""
+        return [module for module in self._instances if module is not None]
 
     def load_modules(self) -> None:
-        """Import and instantiate configured modules."""
+        """Import configured modules and register their constructors."""
         to_load = self.enabled_modules or self.discover_available_modules()
+        import_module = importlib.import_module
+        module_config = self.module_config
+        fonts = self.fonts
         for name in to_load:
-            module_instance = self._load_single_module(name)
-            if module_instance:
-                self.modules.append(module_instance)
+            factory = self._load_single_module(name, import_module, module_config, fonts)
+            if factory:
+                self._names.append(name)
+                self._factories.append(factory)
+                self._instances.append(None)
+                self._hooks.append(None)
 
-        if self.modules:
-            self._active_index = 0
+        self._n_modules = len(self._factories)
+        self._pending = self._n_modules
+        self._active_index = 0
+        # Per-module load messages are flushed together once loading finishes.
+        sys.stdout.flush()
+
+    def _load_single_module(
+        self,
+        module_name: str,
+        import_module: Callable[[str], Any] = importlib.import_module,
+        module_config: Optional[Dict[str, Dict[str, Any]]] = None,
+        fonts: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Callable[[], DisplayModule]]:
+        if module_config is None:
+            module_config = self.module_config
+        if fonts is None:
+            fonts = self.fonts
 
-    def _load_single_module(self, module_name: str) -> Optional[DisplayModule]:
+        full_name = f"{self.modules_package}.{module_name}"
         try:
-            imported = importlib.import_module(f"{self.modules_package}.{module_name}")
+            # Reloads (and repeated managers in one process) skip the import machinery.
+            imported = sys.modules.get(full_name) or import_module(full_name)
         except Exception as exc:
-            print(f"[MODULES] Failed to import {module_name}: {exc}", flush=True)
+            print(f"[MODULES] Failed to import {module_name}: {exc}")
             return None
 
         module_cls = getattr(imported, "Module", None)
         if module_cls is None:
-            print(f"[MODULES] {module_name} has no Module class. Skipping.", flush=True)
+            print(f"[MODULES] {module_name} has no Module class. Skipping.")
             return None
 
-        cfg = self.module_config.get(module_name, {})
+        # Validated once here; instances are trusted without further checks.
+        missing = [hook for hook in _REQUIRED_HOOKS if not callable(getattr(module_cls, hook, None))]
+        if missing:
+            print(f"[MODULES] {module_name} is missing {', '.join(missing)}(). Skipping.")
+            return None
+
+        cfg = module_config.get(module_name, _EMPTY_CFG)
 
         sig = inspect.signature(module_cls.__init__)
         if "fonts" in sig.parameters:
-            instance: DisplayModule = module_cls(config=cfg, fonts=self.fonts)
+            factory = partial(module_cls, config=cfg, fonts=fonts)
         else:
-            instance = module_cls(config=cfg)  # type: ignore[call-arg]
+            factory = partial(module_cls, config=cfg)
+
+        print(f"[MODULES] Loaded module '{module_name}'.")
+        return factory
+
+    def _active_entry(
+        self,
+    ) -> Optional[Tuple[DisplayModule, Tuple[Callable[[], None], Optional[Callable[[str], None]]]]]:
+        """Return the active module and its hooks, constructing it on first use.
+
+        A module whose constructor raises is logged and dropped from rotation,
+        and the next slot is tried in its place.
+        """
+        while True:
+            with self._instantiate_lock:
+                while True:
+                    if not self._n_modules:
+                        return None
+                    index = self._active_index
+                    instance = self._instances[index]
+                    if instance is not None:
+                        return instance, self._hooks[index]
+                    factory = self._factories[index]
+                    if factory not in self._building:
+                        break
+                    # Another thread (usually the tick prefetch) is building it.
+                    self._built.wait()
+                self._building.add(factory)
+                name = self._names[index]
+            self._build(factory, name)
 
-        print(f"[MODULES] Loaded module '{module_name}'.", flush=True)
-        return instance
+    def _build(self, factory: Callable[[], DisplayModule], name: str) -> None:
+        """Run ``factory`` without holding the lock, then publish the result.
+
+        The caller has added ``factory`` to ``_building``, so no other thread
+        builds or drops that slot in the meantime.
+        """
+        instance: Optional[DisplayModule] = None
+        try:
+            instance = factory()
+            hooks = self._resolve_hooks(instance)
+        except Exception as exc:
+            print(f"[MODULES] Failed to start {name}: {exc}", flush=True)
+            instance = None
+
+        with self._instantiate_lock:
+            self._building.discard(factory)
+            index = self._factories.index(factory)
+            if instance is None:
+                self._drop(index)
+            else:
+                # Hooks are in place before the instance is visible in its slot.
+                lock = self._call_locks[id(instance)] = threading.RLock()
+                self._hooks[index] = hooks
+                self._instances[index] = instance
+                self._tick_callables.append((instance, instance.tick, lock))
+                self._pending -= 1
+            self._built.notify_all()
+
+    def _prefetch_next(self) -> None:
+        """Construct the first unbuilt module after the active one, if any."""
+        with self._instantiate_lock:
+            if not self._pending:
+                return
+            n = self._n_modules
+            index = self._active_index
+            for _ in range(n):
+                index += 1
+                if index >= n:
+                    index = 0
+                factory = self._factories[index]
+                if self._instances[index] is None and factory not in self._building:
+                    break
+            else:
+                return
+            self._building.add(factory)
+            name = self._names[index]
+        self._build(factory, name)
+
+    def _drop(self, index: int) -> None:
+        # Caller holds _instantiate_lock.
+        for seq in (self._names, self._factories, self._instances, self._hooks):
+            del seq[index]
+        self._n_modules -= 1
+        self._pending -= 1
+        if self._active_index >= self._n_modules:
+            self._active_index = 0
+
+    def _advance(self) -> None:
+        with self._instantiate_lock:
+            if self._n_modules:
+                nxt = self._active_index + 1
+                self._active_index = 0 if nxt >= self._n_modules else nxt
+
+    def _retreat(self) -> None:
+        with self._instantiate_lock:
+            if self._n_modules:
+                i = self._active_index
+                self._active_index = self._n_modules - 1 if i == 0 else i - 1
+
+    @staticmethod
+    def _resolve_hooks(
+        module: DisplayModule,
+    ) -> Tuple[Callable[[], None], Optional[Callable[[str], None]]]:
+        refresher = getattr(module, "force_refresh", None)
+        handler = getattr(module, "handle_button", None)
+        return (
+            refresher if callable(refresher) else module.tick,
+            handler if callable(handler) else None,
+        )
+
+    def module_lock(self, module: DisplayModule) -> threading.RLock:
+        """Lock to hold while calling into ``module`` from outside the manager."""
+        return self._call_locks[id(module)]
 
     # ------------------------------------------------------------------
     # Navigation helpers
     # ------------------------------------------------------------------
-    def _has_modules(self) -> bool:
-        return bool(self.modules)
-
     def current_module(self) -> Optional[DisplayModule]:
-        if not self._has_modules():
-            return None
-        if self._active_index is None:
-            self._active_index = 0
-        return self.modules[self._active_index]
+        entry = self._active_entry()
+        return entry[0] if entry else None
 
     def next_module(self) -> Optional[DisplayModule]:
-        if not self._has_modules():
+        module = self.current_module()
+        if module is None:
             return None
-        if self._active_index is None:
-            self._active_index = 0
-        module = self.modules[self._active_index]
-        self._active_index = (self._active_index + 1) % len(self.modules)
+        self._advance()
         return module
 
     def prev_module(self) -> Optional[DisplayModule]:
-        if not self._has_modules():
-            return None
-        if self._active_index is None:
-            self._active_index = 0
-        self._active_index = (self._active_index - 1) % len(self.modules)
-        return self.modules[self._active_index]
+        self._retreat()
+        return self.current_module()
 
     def activate_next(self) -> Optional[DisplayModule]:
         """Advance to and return the next module in sequence."""
-        if not self._has_modules():
-            return None
-        if self._active_index is None:
-            self._active_index = 0
-        self._active_index = (self._active_index + 1) % len(self.modules)
+        self._advance()
         return self.current_module()
 
     # ------------------------------------------------------------------
@@ -123,16 +292,13 @@ class ModuleManager:
     def refresh_current(self) -> Optional[DisplayModule]:
         """Force the active module to refresh its data if possible."""
 
-        module = self.current_module()
-        if module is None:
+        entry = self._active_entry()
+        if entry is None:
             return None
 
-        refresher = getattr(module, "force_refresh", None)
-        if callable(refresher):
-            refresher()
-        else:
-            module.tick()
-
+        module, (refresh, _) = entry
+        with self._call_locks[id(module)]:
+            refresh()
         return module
 
     def route_button_event(self, event: str) -> Optional[DisplayModule]:
@@ -144,15 +310,24 @@ class ModuleManager:
         if event == "refresh":
             return self.refresh_current()
         if event == "action":
-            module = self.current_module()
-            if module and hasattr(module, "handle_button"):
-                module.handle_button(event)
+            entry = self._active_entry()
+            if entry is None:
+                return None
+            module, (_, handler) = entry
+            if handler is not None:
+                with self._call_locks[id(module)]:
+                    handler(event)
             return module
         return self.current_module()
 
     def tick_modules(self) -> None:
-        for module in self.modules:
+        # Build one more module per tick, next in rotation first, so modules
+        # start fetching in the background before they are shown.
+        self._prefetch_next()
+
+        for module, tick, lock in tuple(self._tick_callables):
             try:
-                module.tick()
+                with lock:
+                    tick()
             except Exception as exc:
                 print(f"[MODULES] tick() failed for {getattr(module, 'name', module)}: {exc}", flush=True)
@@ -7,7 +7,9 @@ for usage guidance and the new-module template.
 """
 from __future__ import annotations
 
-from typing import Any, Tuple
+import weakref
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Tuple
 
 from PIL import ImageDraw, ImageFont
 
@@ -47,6 +49,108 @@ def get_text_size(draw: ImageDraw.ImageDraw, text: str, font: Any) -> Tuple[int,
     return bbox[2] - bbox[0], bbox[3] - bbox[1]
 
 
+# Text extents per font, then per text. Weakly keyed so short-lived font
+# variants drop their entries instead of pinning the fonts (or being confused
+# with a later font that reuses the same id).
+_TEXT_SIZES: "weakref.WeakKeyDictionary[Any, Dict[str, Tuple[int, int]]]" = weakref.WeakKeyDictionary()
+_TEXT_SIZE_CACHE_LIMIT = 1024
+
+
+def measure_text(draw: ImageDraw.ImageDraw, text: str, font: Any) -> Tuple[int, int]:
+    """Memoized :func:`get_text_size` for 1-bit images.
+
+    Measures on the font directly (no ImageDraw round trip) with the same
+    non-antialiased mode a "1" image draws with, so labels and repeated
+    strings are laid out by FreeType once per font rather than once per frame.
+    """
+    sizes = _TEXT_SIZES.get(font)
+    if sizes is None:
+        sizes = _TEXT_SIZES[font] = {}
+    size = sizes.get(text)
+    if size is None:
+        if len(sizes) >= _TEXT_SIZE_CACHE_LIMIT:
+            sizes.clear()
+        try:
+            left, top, right, bottom = font.getbbox(text, "1")
+            size = (right - left, bottom - top)
+        except AttributeError:  # pragma: no cover - Pillow < 9.2
+            size = draw.textsize(text, font=font)
+        sizes[text] = size
+    return size
+
+
+# Wrapped lines per font, then per (text, max_width, break_long_words).
+_WRAPS: "weakref.WeakKeyDictionary[Any, Dict[Tuple[str, int, bool], Tuple[str, ...]]]" = weakref.WeakKeyDictionary()
+_WRAP_CACHE_LIMIT = 256
+
+
+def wrap_text(text: str, font: Any, max_width: int, break_long_words: bool = False) -> List[str]:
+    """Greedily wrap *text* into lines no wider than *max_width* pixels.
+
+    Words are packed while the line's advance width still fits, measured in
+    the non-antialiased mode a "1" image draws with (hinting makes that wider
+    than the default mode at small sizes). A word wider than a whole line is
+    split at the longest prefix that fits when *break_long_words* is set, and
+    otherwise kept whole on its own line. Results are memoized per font.
+    """
+    wraps = _WRAPS.get(font)
+    if wraps is None:
+        wraps = _WRAPS[font] = {}
+    key = (text, max_width, break_long_words)
+    lines = wraps.get(key)
+    if lines is None:
+        if len(wraps) >= _WRAP_CACHE_LIMIT:
+            wraps.clear()
+        lines = wraps[key] = _greedy_wrap(partial(font.getlength, mode="1"), text, max_width, break_long_words)
+    return list(lines)
+
+
+def _greedy_wrap(
+    getlength: Callable[[str], float], text: str, max_width: int, break_long_words: bool
+) -> Tuple[str, ...]:
+    lines: List[str] = []
+    current = ""
+    for word in text.split():
+        if current:
+            candidate = f"{current} {word}"
+            if getlength(candidate) <= max_width:
+                current = candidate
+                continue
+            lines.append(current)
+        current = word
+        if break_long_words:
+            while len(current) > 1 and getlength(current) > max_width:
+                cut = _fitting_prefix(getlength, current, max_width)
+                lines.append(current[:cut])
+                current = current[cut:]
+    if current:
+        lines.append(current)
+    return tuple(lines)
+
+
+def _fitting_prefix(getlength: Callable[[str], float], word: str, max_width: int) -> int:
+    """Length of the longest prefix of *word* that fits (at least one character)."""
+    lo, hi = 1, len(word) - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if getlength(word[:mid]) <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+@lru_cache(maxsize=256)
+def load_font(path: str, size: int) -> Any:
+    """Return the shared TrueType font for *path* at *size*.
+
+    Every module asking for the same face and size gets the same instance, so
+    the file is opened once per process instead of on every render.
+    Raises OSError like ``ImageFont.truetype`` (failures are not cached).
+    """
+    return ImageFont.truetype(path, size)
+
+
 def fit_header_font(
     draw: ImageDraw.ImageDraw,
     text: str,
@@ -64,14 +168,14 @@ def fit_header_font(
     max_h = header_h - 2 * PAGE_HEADER_RY - 4  # 4 px total vertical safety padding
     for size in range(80, min_size - 1, -1):
         try:
-            font = ImageFont.truetype(HEADER_FONT_PATH, size)
+            font = load_font(HEADER_FONT_PATH, size)
         except Exception:
             return ImageFont.load_default()
         tw, th = get_text_size(draw, text, font)
         if tw <= max_w and th <= max_h:
             return font
     try:
-        return ImageFont.truetype(HEADER_FONT_PATH, min_size)
+        return load_font(HEADER_FONT_PATH, min_size)
     except Exception:
         return ImageFont.load_default()
 
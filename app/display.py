@@ -1,9 +1,72 @@
 import importlib
+import inspect
 import sys
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Protocol
-
-from PIL import Image, ImageDraw, ImageFont
+from types import ModuleType
+from typing import Dict, Optional, Protocol, Tuple
+
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+
+# 8-bit -> 1-bit threshold table: anything below mid-grey becomes black.
+_THRESHOLD_LUT = [0] * 128 + [255] * 128
+# Byte-wise inversion table for bytes.translate (x ^ 0xFF).
+_INVERT_BYTES = bytes(255 - i for i in range(256))
+
+_TRANSPOSE = {
+    90: Image.Transpose.ROTATE_90,
+    180: Image.Transpose.ROTATE_180,
+    270: Image.Transpose.ROTATE_270,
+}
+
+# Share of the panel that may be erased through partial updates before ghosting
+# is cleared with a full refresh.
+ERASURE_LIMIT_FRACTION = 0.05
+# Population count of a non-negative int: int.bit_count is a single C call
+# (hardware POPCNT where available) on Python 3.10+.
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count
+else:  # pragma: no cover - older interpreters
+    def _popcount(value: int) -> int:
+        return bin(value).count("1")
+
+# Default minimum spacing between panel updates, in seconds.
+DEFAULT_MIN_REFRESH_SECONDS = 2.0
+# Default idle time before the panel is put back to sleep, in seconds.
+DEFAULT_SLEEP_AFTER_SECONDS = 3.0
+
+_FAST_METHOD_CANDIDATES = (
+    "display_partial",
+    "displayPartial",
+    "display_Partial",
+    "display_fast",
+    "displayFast",
+)
+# Per driver class: name of its fast display method (None if it has none).
+_FAST_METHOD_NAMES: Dict[type, Optional[str]] = {}
+# Imported waveshare_epd driver modules by name.
+_DRIVER_MODULES: Dict[str, ModuleType] = {}
+
+
+def _get_driver_module(name: str) -> ModuleType:
+    module = _DRIVER_MODULES.get(name)
+    if module is None:
+        module = _DRIVER_MODULES[name] = importlib.import_module(f"waveshare_epd.{name}")
+    return module
+
+
+_STATUS_FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+
+@lru_cache(maxsize=None)
+def _status_font(size: int):
+    """Load the status-text font once per size and share it between drivers."""
+    try:
+        return ImageFont.truetype(_STATUS_FONT_PATH, size)
+    except Exception:
+        return ImageFont.load_default()
 
 
 class DisplayDriver(Protocol):
@@ -37,6 +100,9 @@ class SimulatorDisplayDriver:
         self.render_image(image, force_full_refresh=True)
         return mode
 
+    def demand_full_refresh(self) -> None:
+        print("[Display] Simulator: next frame will be a full refresh.")
+
 
 class HardwareDisplayDriver:
     def __init__(
@@ -46,12 +112,28 @@ class HardwareDisplayDriver:
         library_path: Optional[str] = None,
         pin_config: Optional[Dict[str, int]] = None,
         spi_hz: Optional[int] = None,
+        min_refresh_seconds: float = DEFAULT_MIN_REFRESH_SECONDS,
+        sleep_after_seconds: float = DEFAULT_SLEEP_AFTER_SECONDS,
     ) -> None:
         self.rotation = rotation
         self.driver_name = driver_name
         self.pin_config = pin_config or {}
         self.library_path = library_path
         self.spi_hz = int(spi_hz) if spi_hz else None
+        # Minimum spacing between panel updates (monotonic clock).
+        self._min_interval_s = 0.0
+        self._last_push_monotonic = 0.0
+        self.set_min_interval(min_refresh_seconds)
+        # The panel stays awake this long after a push so bursts of updates
+        # share one init/sleep cycle. The lock guards wake/sleep state against
+        # the sleep timer thread.
+        self._sleep_after = max(float(sleep_after_seconds), 0.0)
+        self._sleep_timer: Optional[threading.Timer] = None
+        # Latest frame held back by the minimum interval, and its push timer.
+        self._deferred: Optional[Tuple[Image.Image, bool]] = None
+        self._deferred_timer: Optional[threading.Timer] = None
+        self._awake_mode: Optional[str] = None  # None (asleep), "full" or "part"
+        self._lock = threading.RLock()
 
         self._ensure_library_path()
 
@@ -64,12 +146,24 @@ class HardwareDisplayDriver:
         # Apply any other config overrides (e.g. busy pin)
         self._apply_simple_overrides()
 
-        driver_module = importlib.import_module(f"waveshare_epd.{self.driver_name}")
+        driver_module = _get_driver_module(self.driver_name)
         self.driver = driver_module.EPD()
 
         self._fast_display = None
-        self._full_refresh_rate = 10  # Perform a full refresh every 10 updates
+        # True when the fast method takes a region (buffer, x0, y0, x1, y1).
+        self._fast_display_region = False
+        self._full_refresh_rate = 10  # Perform a full refresh at least every 10 updates
+        # Ghosting budget: pixels that went black -> white through partial
+        # updates since the last full refresh. Crossing it forces a full refresh.
+        self._erased_limit = 0
+        self._erased_accum = 0
+        self._pending_force_full = False
         self._refresh_counter = self._full_refresh_rate  # Force full refresh on first render
+        # Packed buffer of the frame currently on the panel (None = unknown).
+        self._last_frame: Optional[bytes] = None
+        self._last_prepared: Optional[Image.Image] = None
+        # How frames are packed for the driver; detected on the first frame.
+        self._packing: Optional[str] = None
         
         try:
             print("[Display] Initializing driver...")
@@ -85,6 +179,7 @@ class HardwareDisplayDriver:
                 except TypeError:
                     self.driver.Clear()
             
+            self._awake_mode = "full"
             print("[Display] Driver init successful.")
         except Exception as e:
             print(f"[Display] CRITICAL: Driver init crashed: {e}")
@@ -92,8 +187,21 @@ class HardwareDisplayDriver:
 
         self.width = self.driver.width
         self.height = self.driver.height
+        self._erased_limit = int(self.width * self.height * ERASURE_LIMIT_FRACTION)
 
         self._fast_display = self._detect_fast_display_method()
+        if self._fast_display is not None:
+            self._fast_display_region = self._takes_region(self._fast_display)
+
+        # Bound once: how a regular (non-scheduled-full) frame is pushed, and
+        # how the panel is woken for it.
+        init_part = getattr(self.driver, "init_part", None)
+        self._init_part = init_part if callable(init_part) else None
+        self._display_method = self._push_fast if self._fast_display else self._push_full
+        self._fast_wake_mode = "part" if self._fast_display_region and self._init_part else "full"
+
+        with self._lock:
+            self._schedule_sleep()
 
         print(
             "[Display] Hardware driver initialized "
@@ -105,21 +213,208 @@ class HardwareDisplayDriver:
         return all(callable(getattr(self.driver, name, None)) for name in required)
 
     def _detect_fast_display_method(self):
-        candidates = [
-            "display_partial",
-            "displayPartial",
-            "display_Partial",
-            "display_fast",
-            "displayFast",
-        ]
+        driver_cls = type(self.driver)
+        if driver_cls in _FAST_METHOD_NAMES:
+            name = _FAST_METHOD_NAMES[driver_cls]
+        else:
+            name = next(
+                (candidate for candidate in _FAST_METHOD_CANDIDATES if callable(getattr(self.driver, candidate, None))),
+                None,
+            )
+            _FAST_METHOD_NAMES[driver_cls] = name
+
+        if name is None:
+            return None
+        print(f"[Display] Using fast display method: {name}")
+        return getattr(self.driver, name)
+
+    @staticmethod
+    def _takes_region(method) -> bool:
+        try:
+            params = inspect.signature(method).parameters.values()
+        except (TypeError, ValueError):
+            return False
+        positional = [p for p in params if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
+        return len(positional) >= 5
+
+    def _dirty_region(self, prepared: Image.Image) -> Tuple[int, int, int, int]:
+        """Byte-aligned box of pixels that changed since the last pushed frame."""
+        previous = self._last_prepared
+        if previous is None or previous.size != prepared.size:
+            return 0, 0, self.width, self.height
+
+        bbox = ImageChops.logical_xor(previous, prepared).getbbox()
+        if bbox is None:
+            return 0, 0, self.width, self.height
+        x0, y0, x1, y1 = bbox
+        # The panel addresses columns in whole bytes (8 pixels).
+        return x0 & ~7, y0, min((x1 + 7) & ~7, self.width), y1
+
+    def _region_buffer(self, buffer, region: Tuple[int, int, int, int]) -> bytes:
+        x0, y0, x1, y1 = region
+        stride = self.width // 8
+        start, end = x0 // 8, x1 // 8
+        if start == 0 and end == stride:
+            return bytes(buffer[y0 * stride : y1 * stride])
+        return b"".join(bytes(buffer[row + start : row + end]) for row in range(y0 * stride, y1 * stride, stride))
+
+    def _pack_frame(self, prepared: Image.Image):
+        """Pack a prepared 1-bit frame into the driver's buffer format.
+
+        The first frame goes through ``getbuffer`` and is used to check whether
+        the driver's layout is simply Pillow's packed bits (optionally inverted).
+        If so, later frames are packed directly without the driver's per-byte
+        Python loop.
+        """
+        packing = self._packing
+        if packing is None:
+            buffer = self.driver.getbuffer(prepared)
+            self._packing = self._detect_packing(prepared, buffer)
+            return buffer
+        if packing == "getbuffer":
+            return self.driver.getbuffer(prepared)
+        raw = bytearray(prepared.tobytes())
+        return raw.translate(_INVERT_BYTES) if packing == "inverted" else raw
+
+    @staticmethod
+    def _detect_packing(prepared: Image.Image, buffer) -> Optional[str]:
+        try:
+            packed = bytes(buffer)
+        except TypeError:
+            return "getbuffer"
+        raw = prepared.tobytes()
+        if raw.count(raw[:1]) == len(raw):
+            # A uniform frame cannot tell bit orders apart; decide on a later one.
+            return None
+        if packed == raw:
+            packing = "raw"
+        elif packed == raw.translate(_INVERT_BYTES):
+            packing = "inverted"
+        else:
+            packing = "getbuffer"
+        print(f"[Display] Frame packing: {packing}.")
+        return packing
 
-        for name in candidates:
-            method = getattr(self.driver, name, None)
-            if callable(method):
-                print(f"[Display] Using fast display method: {name}")
-                return method
+    def set_min_interval(self, seconds: float) -> None:
+        """Set the minimum time between panel updates (0 disables the gate)."""
+        self._min_interval_s = max(float(seconds), 0.0)
 
-        return None
+    def _defer_if_too_soon(self, image: Image.Image, force_full_refresh: bool) -> bool:
+        """Hold ``image`` back if the last push was under the minimum interval ago.
+
+        Nothing blocks: the frame is parked and pushed by a timer once the
+        interval is up. A newer frame arriving first replaces it, so bursts
+        (button mashing) collapse into one push of the latest content.
+        Caller holds ``_lock``.
+        """
+        remaining = self._last_push_monotonic + self._min_interval_s - time.monotonic()
+        if remaining <= 0:
+            return False
+        if self._deferred is not None:
+            force_full_refresh = force_full_refresh or self._deferred[1]
+        self._deferred = (image, force_full_refresh)
+        if self._deferred_timer is None:
+            timer = threading.Timer(remaining, self._push_deferred)
+            timer.daemon = True
+            self._deferred_timer = timer
+            timer.start()
+        return True
+
+    def _drop_deferred(self) -> None:
+        self._deferred = None
+        timer = self._deferred_timer
+        if timer is not None:
+            timer.cancel()
+            self._deferred_timer = None
+
+    def _push_deferred(self) -> None:
+        with self._lock:
+            if self._deferred_timer is not threading.current_thread():
+                return
+            self._deferred_timer = None
+            deferred, self._deferred = self._deferred, None
+            if deferred is not None:
+                self._render_locked(*deferred)
+
+    def _wake(self, mode: str) -> None:
+        """Bring the panel up in ``mode`` ("full" or "part") unless it already is."""
+        if self._awake_mode == mode:
+            return
+        # No sleep() is needed when switching modes while awake: Waveshare's
+        # init() and init_part() both open with a hardware reset (RST pulse),
+        # which discards the controller's current mode, and the vendor's own
+        # examples call init_part() straight after full-mode updates.
+        if mode == "part":
+            self._init_part()
+        else:
+            self.driver.init()
+        self._apply_runtime_overrides()
+        self._awake_mode = mode
+
+    def _sleep_locked(self) -> None:
+        if self._awake_mode is not None:
+            # Put display to sleep to prevent burn-in/fading
+            self.driver.sleep()
+            self._awake_mode = None
+
+    def _cancel_sleep(self) -> None:
+        timer = self._sleep_timer
+        if timer is not None:
+            timer.cancel()
+            self._sleep_timer = None
+
+    def _schedule_sleep(self) -> None:
+        self._cancel_sleep()
+        if self._sleep_after <= 0:
+            self._sleep_locked()
+            return
+        timer = threading.Timer(self._sleep_after, self._sleep_when_idle)
+        # A pending sleep must not keep the process alive; shutdown calls sleep().
+        timer.daemon = True
+        self._sleep_timer = timer
+        timer.start()
+
+    def _sleep_when_idle(self) -> None:
+        with self._lock:
+            # A push since this timer was armed replaced it; let that one decide.
+            if self._sleep_timer is not threading.current_thread():
+                return
+            self._sleep_timer = None
+            self._sleep_locked()
+
+    def sleep(self) -> None:
+        """Put the panel to sleep now, dropping any pending idle timer."""
+        with self._lock:
+            self._drop_deferred()
+            self._cancel_sleep()
+            self._sleep_locked()
+
+    def demand_full_refresh(self) -> None:
+        """Make the next frame a full refresh, even if it is unchanged."""
+        self._pending_force_full = True
+
+    def _erased_pixels(self, prepared: Image.Image) -> int:
+        """Count pixels going from black to white relative to the last frame."""
+        previous = self._last_prepared
+        if previous is None or previous.size != prepared.size:
+            return 0
+        # Mode "1" packs white as a set bit.
+        last = int.from_bytes(previous.tobytes(), "big")
+        current = int.from_bytes(prepared.tobytes(), "big")
+        return _popcount(current & ~last)
+
+    def _push_full(self, buffer, prepared: Image.Image) -> None:
+        self.driver.display(buffer)
+
+    def _push_fast(self, buffer, prepared: Image.Image) -> None:
+        if not self._fast_display_region:
+            self._fast_display(buffer)
+            return
+
+        region = self._dirty_region(prepared)
+        x0, y0, x1, y1 = region
+        print(f"[Display] Partial refresh of region ({x0}, {y0})-({x1}, {y1}).")
+        self._fast_display(self._region_buffer(buffer, region), x0, y0, x1, y1)
 
     def _ensure_library_path(self) -> None:
         if not self.library_path:
@@ -134,6 +429,9 @@ class HardwareDisplayDriver:
         Simple variable updates for non-critical pins.
         We assume the critical conflict (RST=17) was resolved by patching the file on disk.
         """
+        if not self.pin_config:
+            return
+
         pin_map = {
             "rst": "RST_PIN",
             "dc": "DC_PIN",
@@ -165,50 +463,54 @@ class HardwareDisplayDriver:
         except Exception as exc:
             print(f"[Display] Failed to override SPI clock: {exc}")
 
+    def _orient(self, img: Image.Image, resample: int) -> Image.Image:
+        """Apply the configured rotation, using a plain transpose when possible."""
+        rotation = self.rotation % 360
+        if not rotation:
+            return img
+        # 180 always maps onto the panel; 90/270 only keep the size on square panels.
+        if rotation == 180 or (rotation in (90, 270) and img.width == img.height):
+            return img.transpose(_TRANSPOSE[rotation])
+        return img.rotate(rotation, expand=False, resample=resample)
+
     def _prepare_image(self, image: Image.Image) -> Image.Image:
         target_size = (self.width, self.height)
 
         # Preserve existing 1-bit content when possible; only resample when size changes.
+        # Every step below returns a new image, so the caller's is never modified.
+        img = image
         if image.size != target_size:
             resize_resample = Image.NEAREST if image.mode == "1" else Image.LANCZOS
             img = image.resize(target_size, resample=resize_resample)
-        else:
-            img = image.copy()
 
-        # Rotate if needed
-        if self.rotation:
-            rotate_resample = Image.NEAREST if img.mode == "1" else Image.BICUBIC
-            img = img.rotate(self.rotation, expand=False, resample=rotate_resample)
+        img = self._orient(img, Image.NEAREST if img.mode == "1" else Image.BICUBIC)
 
         # If callers already prepared a 1-bit image (e.g. after-hours photo dithering),
         # pass it through unchanged so panel-ready dithering is not destroyed.
         if img.mode == "1":
-            return img
+            return image.copy() if img is image else img
 
-        # Convert all other inputs to 1-bit via a stable threshold.
-        return img.convert("L").point(lambda x: 0 if x < 128 else 255, "1")
+        # Convert all other inputs to 1-bit via a stable threshold. Greyscale
+        # frames go straight to the table lookup without an extra "L" copy.
+        if img.mode != "L":
+            img = img.convert("L")
+        return img.point(_THRESHOLD_LUT, "1")
 
     def _prepare_four_gray_image(self, image: Image.Image) -> Image.Image:
         target_size = (self.width, self.height)
 
+        img = image
         if image.size != target_size:
             img = image.resize(target_size, resample=Image.LANCZOS)
-        else:
-            img = image.copy()
-
-        if self.rotation:
-            img = img.rotate(self.rotation, expand=False, resample=Image.BICUBIC)
 
+        img = self._orient(img, Image.BICUBIC)
         return img.convert("L")
 
     def render_text(self, text: str) -> None:
         image = Image.new("1", (self.width, self.height), 255)
         draw = ImageDraw.Draw(image)
 
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 24)
-        except Exception:
-            font = ImageFont.load_default()
+        font = _status_font(24)
 
         draw.multiline_text((10, 10), text, font=font, fill=0, spacing=4)
         # Render via the main pipeline so it handles init/sleep
@@ -218,35 +520,82 @@ class HardwareDisplayDriver:
         if not isinstance(image, Image.Image):
             raise TypeError("HardwareDisplayDriver expects a PIL.Image for render_image")
 
-        try:
-            # Wake up the display
-            self.driver.init()
-            self._apply_runtime_overrides()
+        # Held throughout: the deferred-push timer renders from its own thread.
+        with self._lock:
+            self._render_locked(image, force_full_refresh)
 
-            prepared = self._prepare_image(image)
-            buffer = self.driver.getbuffer(prepared)
+    def _render_locked(self, image: Image.Image, force_full_refresh: bool) -> None:
+        force_full_refresh = force_full_refresh or self._pending_force_full
+        prepared = self._prepare_image(image)
+        buffer = self._pack_frame(prepared)
 
-            # Increment refresh counter
-            self._refresh_counter += 1
+        # Identical frame already on the panel: skip the wake/SPI/sleep cycle.
+        snapshot = bytes(buffer)
+        if not force_full_refresh and snapshot == self._last_frame:
+            # Whatever was held back is older than this and already superseded.
+            self._drop_deferred()
+            return
+        if self._defer_if_too_soon(image, force_full_refresh):
+            return
+        self._drop_deferred()
+        self._last_frame = None
+
+        # Increment refresh counter
+        self._refresh_counter += 1
+        erased = 0
+        if not force_full_refresh:
+            erased = self._erased_pixels(prepared)
+        full = (
+            force_full_refresh
+            or self._refresh_counter >= self._full_refresh_rate
+            or self._erased_accum + erased > self._erased_limit
+        )
+        push = self._push_full if full else self._display_method
+
+        with self._lock:
+            self._cancel_sleep()
+            try:
+                # Wake up the display (in partial mode for fast updates when supported)
+                self._wake("full" if full else self._fast_wake_mode)
+
+                # Check if we should force a full refresh
+                if full:
+                    if force_full_refresh:
+                        reason = "manual request"
+                    elif self._refresh_counter >= self._full_refresh_rate:
+                        reason = f"count={self._refresh_counter}"
+                    else:
+                        reason = f"erased={self._erased_accum + erased}"
+                    print(f"[Display] Triggering full refresh ({reason}).")
+                    self._refresh_counter = 0
+                    self._erased_accum = 0
+                    self._pending_force_full = False
+                else:
+                    self._erased_accum += erased
 
-            # Check if we should force a full refresh
-            if force_full_refresh or self._refresh_counter >= self._full_refresh_rate:
-                reason = "manual request" if force_full_refresh else f"count={self._refresh_counter}"
-                print(f"[Display] Triggering full refresh ({reason}).")
-                self._refresh_counter = 0
-                self.driver.display(buffer)
-            elif self._fast_display:
                 try:
-                    self._fast_display(buffer)
+                    push(buffer, prepared)
                 except Exception as exc:
-                    print(f"[Display] Fast display failed ({exc}); falling back to full refresh.")
-                    self.driver.display(buffer)
-            else:
-                self.driver.display(buffer)
+                    if push == self._push_full:
+                        raise
+                    # Downgrade for good: a fast method that fails once will keep failing.
+                    print(f"[Display] Fast display failed ({exc}); using full refreshes from now on.")
+                    self._display_method = self._push_full
+                    self._fast_wake_mode = "full"
+                    self._awake_mode = None
+                    self._wake("full")
+                    self._push_full(buffer, prepared)
+            except Exception:
+                self._sleep_locked()
+                raise
+            finally:
+                self._last_push_monotonic = time.monotonic()
 
-        finally:
-            # Always put display to sleep to prevent burn-in/fading
-            self.driver.sleep()
+            # Sleep once the panel has been idle for a moment, not after every push.
+            self._schedule_sleep()
+
+        self._last_frame = snapshot
+        self._last_prepared = prepared
 
     def render_photo(self, image: object, mode: str = "1bit_floyd") -> str:
         if not isinstance(image, Image.Image):
@@ -254,20 +603,28 @@ class HardwareDisplayDriver:
 
         normalized_mode = (mode or "1bit_floyd").lower()
         if normalized_mode == "4gray" and self.supports_four_gray():
-            try:
-                init_4gray = getattr(self.driver, "init_4Gray")
-                getbuffer_4gray = getattr(self.driver, "getbuffer_4Gray")
-                display_4gray = getattr(self.driver, "display_4Gray")
-
-                init_4gray()
-                self._apply_runtime_overrides()
-                prepared = self._prepare_four_gray_image(image)
-                buffer = getbuffer_4gray(prepared)
-                display_4gray(buffer)
-                self._refresh_counter = 0
-                return "4gray"
-            finally:
-                self.driver.sleep()
+            with self._lock:
+                self._cancel_sleep()
+                try:
+                    init_4gray = getattr(self.driver, "init_4Gray")
+                    getbuffer_4gray = getattr(self.driver, "getbuffer_4Gray")
+                    display_4gray = getattr(self.driver, "display_4Gray")
+
+                    # Marked awake first so the panel is put to sleep even if init fails.
+                    self._awake_mode = "4gray"
+                    init_4gray()
+                    self._apply_runtime_overrides()
+                    prepared = self._prepare_four_gray_image(image)
+                    buffer = getbuffer_4gray(prepared)
+                    self._last_frame = None
+                    self._last_prepared = None
+                    display_4gray(buffer)
+                    # A full refresh: restart both ghosting budgets.
+                    self._refresh_counter = 0
+                    self._erased_accum = 0
+                    return "4gray"
+                finally:
+                    self._sleep_locked()
 
         self.render_image(image, force_full_refresh=True)
         return normalized_mode
@@ -283,6 +640,8 @@ class Display:
         library_path: Optional[str] = None,
         pin_config: Optional[Dict[str, int]] = None,
         spi_hz: Optional[int] = None,
+        min_refresh_seconds: float = DEFAULT_MIN_REFRESH_SECONDS,
+        sleep_after_seconds: float = DEFAULT_SLEEP_AFTER_SECONDS,
     ):
         self.simulate = simulate
         self.rotation = rotation
@@ -290,7 +649,11 @@ class Display:
         self.library_path = library_path
         self.pin_config = pin_config
         self.spi_hz = spi_hz
+        self.min_refresh_seconds = min_refresh_seconds
+        self.sleep_after_seconds = sleep_after_seconds
         self.driver: DisplayDriver = driver or self._select_driver()
+        # Scratch canvas for status text, created once the panel size is known.
+        self._text_canvas: Optional[Image.Image] = None
 
     def _select_driver(self) -> DisplayDriver:
         if self.simulate:
@@ -301,6 +664,8 @@ class Display:
             library_path=self.library_path,
             pin_config=self.pin_config,
             spi_hz=self.spi_hz,
+            min_refresh_seconds=self.min_refresh_seconds,
+            sleep_after_seconds=self.sleep_after_seconds,
         )
 
     def render(self, content: object, force_full_refresh: bool = False) -> None:
@@ -329,6 +694,18 @@ class Display:
         self.render_image(image, force_full_refresh=True)
         return mode
 
+    def demand_full_refresh(self) -> None:
+        """Ask the driver to clear ghosting with a full refresh on the next frame."""
+        demand = getattr(self.driver, "demand_full_refresh", None)
+        if callable(demand):
+            demand()
+
+    def sleep(self) -> None:
+        """Put the panel to sleep, e.g. on shutdown."""
+        sleep = getattr(self.driver, "sleep", None)
+        if callable(sleep):
+            sleep()
+
     def supports_four_gray(self) -> bool:
         checker = getattr(self.driver, "supports_four_gray", None)
         return bool(callable(checker) and checker())
@@ -337,13 +714,14 @@ class Display:
         width = getattr(self.driver, "width", 800)
         height = getattr(self.driver, "height", 480)
 
-        image = Image.new("1", (width, height), 255)
+        image = self._text_canvas
+        if image is None or image.size != (width, height):
+            image = self._text_canvas = Image.new("1", (width, height), 255)
+        else:
+            image.paste(255, (0, 0, width, height))
         draw = ImageDraw.Draw(image)
 
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 28)
-        except Exception:
-            font = ImageFont.load_default()
+        font = _status_font(28)
 
         bbox = draw.textbbox((0, 0), text, font=font)
         text_w = bbox[2] - bbox[0]
@@ -352,10 +730,16 @@ class Display:
         y = (height - text_h) // 2
 
         draw.text((x, y), text, font=font, fill=0)
-        return self._add_border(image)
+        # The scratch canvas is ours, so the border can go straight onto it.
+        return self._apply_border_inplace(image)
 
     def _add_border(self, image: Image.Image, thickness: int = 8, inset: int = 6) -> Image.Image:
-        bordered = image.copy()
+        """Return a bordered copy; module frames may be cached by their module."""
+        return self._apply_border_inplace(image.copy(), thickness, inset)
+
+    def _apply_border_inplace(self, image: Image.Image, thickness: int = 8, inset: int = 6) -> Image.Image:
+        """Draw the frame border directly onto ``image`` and return it."""
+        bordered = image
         draw = ImageDraw.Draw(bordered)
 
         outer = [0, 0, bordered.width - 1, bordered.height - 1]
@@ -2,18 +2,20 @@
 #!/usr/bin/env python3
 
 import argparse
+import queue
 import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import yaml
 from PIL import Image, ImageDraw, ImageEnhance, ImageFilter, ImageFont, ImageOps  # <--- Need this to load fonts
 
 from app.buttons import init_buttons
 from app.core.module_manager import ModuleManager
-from app.display import Display
+from app.core.theme import load_font
+from app.display import DEFAULT_MIN_REFRESH_SECONDS, DEFAULT_SLEEP_AFTER_SECONDS, Display
 
 
 DEFAULT_CONFIG_PATH = Path("config/config.yml")
@@ -82,9 +84,9 @@ def load_fonts() -> Dict[str, Any]:
     fonts = {}
     try:
         # Adjust paths/sizes as you like
-        fonts["default"] = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 24)
-        fonts["large"] = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 48)
-        fonts["small"] = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 18)
+        fonts["default"] = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 24)
+        fonts["large"] = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 48)
+        fonts["small"] = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 18)
     except IOError:
         print("[MAIN] Warning: Could not load TrueType fonts. Using default bitmap font.")
         default = ImageFont.load_default()
@@ -106,6 +108,8 @@ def build_display(config: Dict[str, Any], force_simulate: bool) -> Display:
     driver_name = hardware_cfg.get("driver", "epd7in5_V2")
     library_path = hardware_cfg.get("library_path")
     spi_hz = hardware_cfg.get("spi_hz")
+    min_refresh_seconds = float(hardware_cfg.get("min_refresh_seconds", DEFAULT_MIN_REFRESH_SECONDS))
+    sleep_after_seconds = float(hardware_cfg.get("sleep_after_seconds", DEFAULT_SLEEP_AFTER_SECONDS))
     pins_cfg = hardware_cfg.get("pins") or {}
     pin_config = {key: int(value) for key, value in pins_cfg.items()}
     return Display(
@@ -115,6 +119,8 @@ def build_display(config: Dict[str, Any], force_simulate: bool) -> Display:
         library_path=library_path,
         pin_config=pin_config,
         spi_hz=int(spi_hz) if spi_hz else None,
+        min_refresh_seconds=min_refresh_seconds,
+        sleep_after_seconds=sleep_after_seconds,
     )
 
 # <--- UPDATED: Accepts fonts
@@ -147,6 +153,35 @@ def build_module_manager(config: Dict[str, Any], fonts: Dict[str, Any]) -> Modul
     return manager
 
 
+def _parse_minute_of_day(value: Any) -> Optional[int]:
+    """Parse an "HH:MM" string into minutes after midnight (None if invalid)."""
+    try:
+        hours, minutes = str(value).strip().split(":")
+        hour, minute = int(hours), int(minutes)
+    except (TypeError, ValueError):
+        return None
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        return None
+    return hour * 60 + minute
+
+
+def _after_hours_window(config: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+    """Return the enabled after-hours window as (start, end) minutes of day."""
+    ah_cfg = config.get("hardware", {}).get("after_hours", {})
+    if not ah_cfg.get("enabled", False):
+        return None
+    ah_start = ah_cfg.get("start", "")
+    ah_end = ah_cfg.get("end", "")
+    if not (ah_start and ah_end):
+        return None
+    start = _parse_minute_of_day(ah_start)
+    end = _parse_minute_of_day(ah_end)
+    if start is None or end is None:
+        print(f"[MAIN] Ignoring after hours window with invalid times: {ah_start!r} - {ah_end!r}", flush=True)
+        return None
+    return start, end
+
+
 def _normalize_after_hours_render_mode(raw_mode: Any) -> str:
     mode = str(raw_mode or "1bit_floyd").strip().lower()
     return mode if mode in _AFTER_HOURS_RENDER_MODES else "1bit_floyd"
@@ -408,12 +443,8 @@ def main() -> None:
     
     # Event to wake the main loop for immediate updates
     wake_event = threading.Event()
-    
-    # State to track if the next render should be a full refresh
-    next_render_force_full = False
 
     def render_active_module() -> None:
-        nonlocal next_render_force_full
         module = manager.current_module()
         if module is None:
             display.render_text("No modules enabled.")
@@ -422,26 +453,49 @@ def main() -> None:
         try:
             w = display.driver.width
             h = display.driver.height
-            content = module.render(width=w, height=h)
-            
-            # Render with the force flag if set
-            display.render(content, force_full_refresh=next_render_force_full)
-            
-            # Reset flag after rendering
-            if next_render_force_full:
-                next_render_force_full = False
-                
+            # Held so the main loop's tick() cannot change the module's state mid-frame.
+            with manager.module_lock(module):
+                content = module.render(width=w, height=h)
+
+            # A pending full-refresh request (refresh button) is tracked by the driver.
+            display.render(content)
+
         except Exception as exc:
             print(f"[MAIN] Error rendering module {module}: {exc}", flush=True)
 
+    # Panel updates (driver init, SPI transfer, sleep) run on a single render
+    # thread. At most one request is queued; anything arriving while one is
+    # pending is coalesced into it, since a render always shows the latest state.
+    render_queue: "queue.Queue[None]" = queue.Queue(maxsize=1)
+    # Set while the after-hours screen owns the panel; module renders are skipped.
+    after_hours_active = threading.Event()
+
+    def request_render() -> None:
+        try:
+            render_queue.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def render_worker() -> None:
+        while True:
+            render_queue.get()
+            try:
+                if not after_hours_active.is_set():
+                    render_active_module()
+            finally:
+                render_queue.task_done()
+
+    threading.Thread(target=render_worker, name="render", daemon=True).start()
+
     def on_button(event: str) -> None:
-        nonlocal next_render_force_full
-        # Handle state change immediately, then wake the loop to render
+        # Handle state change immediately, hand the redraw to the render thread,
+        # then wake the loop so the cycle timer restarts.
         manager.route_button_event(event)
-        
+
         if event == "refresh":
-            next_render_force_full = True
-            
+            display.demand_full_refresh()
+
+        request_render()
         wake_event.set()
 
     init_buttons(display, simulate=display.simulate, on_event=on_button)
@@ -451,42 +505,52 @@ def main() -> None:
     max_cycles = args.cycles
     cycle_count = 0
     _after_hours_rendered = False
+    # Parsed once: the window is compared as integer minutes of the day.
+    after_hours_window = _after_hours_window(config)
 
     print(f"[MAIN] Cycle delay: {cycle_delay}s.", flush=True)
 
+    # True when a button press has already queued the render for this cycle.
+    render_pending = False
+
     try:
         while True:
             # 1. Check After Hours
-            ah_cfg = config.get("hardware", {}).get("after_hours", {})
             is_after_hours = False
-            if ah_cfg.get("enabled", False):
-                ah_start = ah_cfg.get("start", "")
-                ah_end   = ah_cfg.get("end", "")
-                if ah_start and ah_end:
-                    current_time = datetime.now().strftime("%H:%M")
-                    if ah_start > ah_end:   # crosses midnight
-                        is_after_hours = current_time >= ah_start or current_time < ah_end
-                    else:
-                        is_after_hours = ah_start <= current_time < ah_end
+            if after_hours_window:
+                ah_start, ah_end = after_hours_window
+                now = datetime.now()
+                current_min = now.hour * 60 + now.minute
+                if ah_start > ah_end:   # crosses midnight
+                    is_after_hours = current_min >= ah_start or current_min < ah_end
+                else:
+                    is_after_hours = ah_start <= current_min < ah_end
 
             if is_after_hours:
                 if not _after_hours_rendered:
+                    after_hours_active.set()
+                    render_queue.join()  # let any in-flight module render finish first
                     _render_after_hours(display, config, fonts)
                     _after_hours_rendered = True
-                time.sleep(60)
+                # Wake on the next minute boundary, the only point the window can end.
+                time.sleep(60 - datetime.now().second)
                 continue
 
             _after_hours_rendered = False  # reset when we exit the after hours window
+            after_hours_active.clear()
 
-            # 2. Render
-            render_active_module()
+            # 2. Render (on the render thread)
+            if not render_pending:
+                request_render()
+            render_pending = False
 
             # 3. Background Ticks
             manager.tick_modules()
-            
+
             # 4. Check Exit Condition
             cycle_count += 1
             if max_cycles and cycle_count >= max_cycles:
+                render_queue.join()
                 print("[MAIN] Completed requested render cycles. Exiting.")
                 break
 
@@ -498,6 +562,8 @@ def main() -> None:
                 # Button was pressed. State has already changed in on_button.
                 # Clear the event so we can wait again next time.
                 wake_event.clear()
+                # on_button already queued the redraw for the new state.
+                render_pending = True
                 # We skip activate_next() because the user likely navigated manually.
             else:
                 # Timeout occurred: Auto-advance to next module
@@ -505,6 +571,8 @@ def main() -> None:
 
     except KeyboardInterrupt:
         print("[MAIN] Exiting...")
+    finally:
+        display.sleep()
 
 
 if __name__ == "__main__":
@@ -1,13 +1,56 @@
 # app/modules/clock.py
 
+import json
+import locale
 import logging
+import os
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Sequence, Tuple
+from operator import methodcaller
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
 import requests
 from PIL import Image, ImageDraw, ImageFont
 
 from app.core.module_interface import DEFAULT_LAYOUTS, LayoutPreset
+from app.core.theme import load_font
+
+# Weather survives restarts here (one file per rounded location and unit).
+_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "dumb-smart-display"
+
+# Upper bound on memoized text extents (a day of HH:MM strings plus headroom).
+_TEXT_SIZE_CACHE_LIMIT = 4096
+
+# Transient Open-Meteo errors are retried with backoff (0.5s, 1s, ...) before
+# giving up; after a give-up the next scheduled attempt comes this much sooner.
+_WEATHER_ATTEMPTS = 3
+_WEATHER_BACKOFF_SECONDS = 0.5
+_WEATHER_RETRY_AFTER_SECONDS = 60
+
+_WEATHER_LABELS = ("Now", "High", "Low")
+
+# Common time/date formats emitted directly instead of re-parsing the format
+# string through strftime on every frame check.
+_FAST_FORMATS: Dict[str, Callable[[datetime], str]] = {
+    "%H:%M": lambda n: f"{n.hour:02d}:{n.minute:02d}",
+    "%I:%M": lambda n: f"{n.hour % 12 or 12:02d}:{n.minute:02d}",
+}
+_DAY_ABBR = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTH_ABBR = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+# Name-bearing formats, only valid while LC_TIME is the default C locale.
+_FAST_C_FORMATS: Dict[str, Callable[[datetime], str]] = {
+    "%I:%M %p": lambda n: f"{n.hour % 12 or 12:02d}:{n.minute:02d} {'PM' if n.hour >= 12 else 'AM'}",
+    "%a, %b %d": lambda n: f"{_DAY_ABBR[n.weekday()]}, {_MONTH_ABBR[n.month - 1]} {n.day:02d}",
+}
+
+
+def _formatter(fmt: str) -> Callable[[datetime], str]:
+    fast = _FAST_FORMATS.get(fmt)
+    if fast is None and locale.setlocale(locale.LC_TIME) in ("C", "POSIX"):
+        fast = _FAST_C_FORMATS.get(fmt)
+    return fast or methodcaller("strftime", fmt)
 
 class Module:
     name = "clock"
@@ -19,11 +62,16 @@ class Module:
         # Configurable formats with defaults
         self.time_format = self.config.get("time_format", "%H:%M")
         self.date_format = self.config.get("date_format", "%a, %b %d")
+        self._format_time = _formatter(self.time_format)
+        self._format_date = _formatter(self.date_format)
 
         # Weather configuration
         self.latitude = self.config.get("latitude")
         self.longitude = self.config.get("longitude")
         self.temperature_unit = self.config.get("temperature_unit", "fahrenheit")
+        fahrenheit = str(self.temperature_unit).lower().startswith("f")
+        self._unit_api = "fahrenheit" if fahrenheit else "celsius"
+        self._unit_symbol = "°F" if fahrenheit else "°C"
         self.weather_refresh_seconds = int(self.config.get("refresh_seconds", 1800))
         self.location_label = self.config.get("location_name", "Today")
 
@@ -38,10 +86,40 @@ class Module:
             "low": None,
         }
         self.last_weather_fetch: Optional[datetime] = None
+        # Earliest time a scheduled fetch may run again after a failed one.
+        self._next_weather_attempt: Optional[datetime] = None
         self.log = logging.getLogger(__name__)
+        # Kept-alive connection to Open-Meteo; refreshes skip the TCP/TLS handshake.
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = "dumb-smart-display/clock"
+        self._weather_cache_path = self._weather_cache_file()
+        self._load_weather_cache()
+        # Scheduled refreshes run on a background thread while render keeps
+        # serving the last known values (stale-while-revalidate).
+        self._fetch_lock = threading.Lock()
+        self._fetch_inflight = False
 
         self._default_layout = DEFAULT_LAYOUTS[0]
         self._layout_lookup = {layout.name: layout for layout in DEFAULT_LAYOUTS}
+        # Pixel slot boxes per (layout name, width, height); geometry never changes.
+        self._slot_cache: Dict[Tuple[str, int, int], Dict[str, Tuple[int, int, int, int]]] = {}
+
+        # Last rendered frame and the visible state it was drawn from. The
+        # display copies images before drawing on them, so handing back the
+        # cached frame is safe.
+        self._frame: Optional[Image.Image] = None
+        self._frame_key: Optional[Tuple[Any, ...]] = None
+        # Weather card outline, dividers and labels per (width, height, invert), pasted
+        # through a mask of their own ink so neighbouring pixels are untouched.
+        self._card_chrome: Dict[Tuple[int, int, bool], Tuple[Image.Image, Image.Image]] = {}
+        # Single 1-bit canvas reused (and cleared) for every redraw.
+        self._canvas: Optional[Image.Image] = None
+
+        # Text extents keyed by (font id, text). Fonts live as long as the module
+        # and the clock only ever shows a bounded set of strings, so sizes are
+        # measured once and then looked up.
+        self._text_sizes: Dict[Tuple[int, str], Tuple[int, int]] = {}
+        self._measure = self._measure_bbox if hasattr(ImageFont.ImageFont, "getbbox") else self._measure_legacy
 
     def _load_custom_font(self, size_key: str, default_size: int, fallback_font_key: str) -> Any:
         """
@@ -52,29 +130,40 @@ class Module:
         font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
         
         try:
-            return ImageFont.truetype(font_path, target_size)
+            return load_font(font_path, target_size)
         except IOError:
             # If the specific font file isn't found, use the one passed from main.py
             return self.fonts.get(fallback_font_key, ImageFont.load_default())
 
     def _get_text_size(self, draw: ImageDraw.Draw, text: str, font: Any) -> Tuple[int, int]:
         """Compatible text size calculator for new and old Pillow versions."""
-        try:
-            # Modern Pillow (>=10.0.0)
-            left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
-            return right - left, bottom - top
-        except AttributeError:
-            # Older Pillow
-            return draw.textsize(text, font=font)
-
-    def _render_full(self, width: int, height: int) -> Image.Image:
+        key = (id(font), text)
+        size = self._text_sizes.get(key)
+        if size is None:
+            if len(self._text_sizes) >= _TEXT_SIZE_CACHE_LIMIT:
+                self._text_sizes.clear()
+            size = self._text_sizes[key] = self._measure(draw, text, font)
+        return size
+
+    @staticmethod
+    def _measure_bbox(draw: ImageDraw.Draw, text: str, font: Any) -> Tuple[int, int]:
+        # Modern Pillow (>=9.2): measure on the font directly, no ImageDraw round trip.
+        left, top, right, bottom = font.getbbox(text, "1")
+        return right - left, bottom - top
+
+    @staticmethod
+    def _measure_legacy(draw: ImageDraw.Draw, text: str, font: Any) -> Tuple[int, int]:
+        # Older Pillow
+        return draw.textsize(text, font=font)
+
+    def _render_full(self, width: int, height: int, now: Optional[datetime] = None) -> Image.Image:
         """Classic full-screen light layout used before layout presets."""
-        image = Image.new("1", (width, height), 255)
+        image = self._blank_canvas(width, height)
         draw = ImageDraw.Draw(image)
 
-        now = datetime.now()
-        time_str = now.strftime(self.time_format)
-        date_str = now.strftime(self.date_format)
+        now = now or datetime.now()
+        time_str = self._format_time(now)
+        date_str = self._format_date(now)
 
         header_text = self.location_label or "Today"
 
@@ -126,46 +215,8 @@ class Module:
         card_right = width - body_padding
         card_bottom = min(card_top + card_height, height - body_padding)
 
-        draw.rounded_rectangle(
-            [(card_left, card_top), (card_right, card_bottom)],
-            radius=16,
-            outline=0,
-            width=2,
-        )
-
-        label_font = self.fonts.get("default")
-        value_font = self.fonts.get("large", self.fonts.get("default"))
-
-        temps = [
-            self._format_temperature(self.weather.get("current"), fallback="--"),
-            self._format_temperature(self.weather.get("high"), fallback="--"),
-            self._format_temperature(self.weather.get("low"), fallback="--"),
-        ]
-        labels = ["Now", "High", "Low"]
-
-        x0, y0, x1, y1 = card_left, card_top, card_right, card_bottom
-        text_fill = 0
-        col_width = (x1 - x0) // 3
-        col_centers = [x0 + col_width * i + col_width // 2 for i in range(3)]
-        content_top = y0 + 18
-
-        for idx, (label, value) in enumerate(zip(labels, temps)):
-            lw, lh = self._get_text_size(draw, label, label_font)
-            vw, vh = self._get_text_size(draw, value, value_font)
-            cx = col_centers[idx]
-            draw.text((cx - lw // 2, content_top), label, font=label_font, fill=text_fill)
-            draw.text((cx - vw // 2, content_top + lh + 8), value, font=value_font, fill=text_fill)
-
-        draw.line([(x0 + col_width, y0 + 10), (x0 + col_width, y1 - 10)], fill=text_fill, width=1)
-        draw.line([(x0 + 2 * col_width, y0 + 10), (x0 + 2 * col_width, y1 - 10)], fill=text_fill, width=1)
-
-        if self.last_weather_fetch:
-            age = datetime.now() - self.last_weather_fetch
-            minutes = int(age.total_seconds() // 60)
-            updated_text = f"Updated {minutes}m ago"
-            footer_font = self.fonts.get("small", label_font)
-            fw, fh = self._get_text_size(draw, updated_text, footer_font)
-            draw.text((x1 - fw - 10, y1 - fh - 8), updated_text, font=footer_font, fill=text_fill)
+        # Same card as the layout presets; the inset is undone so it lands on these edges.
+        self._draw_weather_card(image, draw, (card_left - 12, card_top - 12, card_right + 12, card_bottom + 12), now)
 
         return image
 
@@ -176,40 +227,12 @@ class Module:
             return self._layout_lookup.get(layout_hint, self._default_layout)
         return self._default_layout
 
-    def _find_first_fit(self, columns: int, rows: int, colspan: int, rowspan: int, occupied: list[list[bool]]) -> Optional[Tuple[int, int]]:
-        for row in range(rows):
-            for col in range(columns):
-                if row + rowspan > rows or col + colspan > columns:
-                    continue
-                if any(
-                    occupied[r][c]
-                    for r in range(row, row + rowspan)
-                    for c in range(col, col + colspan)
-                ):
-                    continue
-                for r in range(row, row + rowspan):
-                    for c in range(col, col + colspan):
-                        occupied[r][c] = True
-                return col, row
-        return None
-
     def _layout_slots(self, layout: LayoutPreset, width: int, height: int) -> Dict[str, Tuple[int, int, int, int]]:
-        cell_w = width / layout.columns
-        cell_h = height / layout.rows
-        occupied = [[False for _ in range(layout.columns)] for _ in range(layout.rows)]
-        slots: Dict[str, Tuple[int, int, int, int]] = {}
-
-        for slot in layout.slots:
-            start = self._find_first_fit(layout.columns, layout.rows, slot.colspan, slot.rowspan, occupied)
-            if start is None:
-                continue
-            col, row = start
-            x0 = int(round(col * cell_w))
-            y0 = int(round(row * cell_h))
-            x1 = int(round((col + slot.colspan) * cell_w))
-            y1 = int(round((row + slot.rowspan) * cell_h))
-            slots[slot.key] = (x0, y0, x1, y1)
-
+        # Placement is precomputed on the preset (bitmask first-fit); only scale it.
+        key = (layout.name, width, height)
+        slots = self._slot_cache.get(key)
+        if slots is None:
+            slots = self._slot_cache[key] = layout.slot_boxes(width, height)
         return slots
 
     def _inset_box(self, box: Tuple[int, int, int, int], padding: int) -> Tuple[int, int, int, int]:
@@ -232,80 +255,165 @@ class Module:
         x0, y0, x1, y1 = self._inset_box(box, 12)
         draw.rounded_rectangle([(x0, y0), (x1, y1)], radius=18, outline=0, width=2)
 
+        # Lines are centred by Pillow's "ma" anchor (middle, ascender); only
+        # heights are measured, for the vertical advance.
+        center_x = (x0 + x1) // 2
         header_font = self.fonts.get("large", self.fonts.get("default"))
-        header_w, header_h = self._get_text_size(draw, header_text, header_font)
+        _, header_h = self._get_text_size(draw, header_text, header_font)
         header_y = y0 + 12
-        draw.text(((x0 + x1 - header_w) // 2, header_y), header_text, font=header_font, fill=0)
+        draw.text((center_x, header_y), header_text, font=header_font, fill=0, anchor="ma")
 
-        time_str = now.strftime(self.time_format)
-        date_str = now.strftime(self.date_format)
-        time_w, time_h = self._get_text_size(draw, time_str, self.time_font)
-        date_w, date_h = self._get_text_size(draw, date_str, self.date_font)
+        time_str = self._format_time(now)
+        date_str = self._format_date(now)
+        _, time_h = self._get_text_size(draw, time_str, self.time_font)
+        _, date_h = self._get_text_size(draw, date_str, self.date_font)
 
-        center_x = (x0 + x1) // 2
         time_y = header_y + header_h + 14
         date_y = time_y + time_h + 16
 
-        draw.text((center_x - time_w // 2, time_y), time_str, font=self.time_font, fill=0)
-        draw.text((center_x - date_w // 2, date_y), date_str, font=self.date_font, fill=0)
+        draw.text((center_x, time_y), time_str, font=self.time_font, fill=0, anchor="ma")
+        draw.text((center_x, date_y), date_str, font=self.date_font, fill=0, anchor="ma")
 
         return date_y + date_h
 
+    def _weather_chrome(self, width: int, height: int, invert: bool) -> Tuple[Image.Image, Image.Image]:
+        """Return ``(chrome, mask)`` for a weather card spanning ``width`` x ``height``.
+
+        The chrome holds everything static about the card: outline, dividers and
+        the column labels. Only the values and footer are drawn per frame.
+        """
+        key = (width, height, invert)
+        cached = self._card_chrome.get(key)
+        if cached is not None:
+            return cached
+
+        size = (width + 1, height + 1)
+        chrome = Image.new("1", size, 255)
+        mask = Image.new("1", size, 0)
+        label_font = self.fonts.get("default")
+        col_width = width // 3
+        text_fill = 255 if invert else 0
+        for target, ink, text_ink in ((chrome, 0, text_fill), (mask, 1, 1)):
+            d = ImageDraw.Draw(target)
+            d.rounded_rectangle(
+                [(0, 0), (width, height)], radius=16, outline=ink, width=2, fill=ink if invert else None
+            )
+            for idx, label in enumerate(_WEATHER_LABELS):
+                lw, _ = self._get_text_size(d, label, label_font)
+                cx = col_width * idx + col_width // 2
+                d.text((cx - lw // 2, 18), label, font=label_font, fill=text_ink)
+            d.line([(col_width, 10), (col_width, height - 10)], fill=text_ink, width=1)
+            d.line([(2 * col_width, 10), (2 * col_width, height - 10)], fill=text_ink, width=1)
+
+        if len(self._card_chrome) >= 8:
+            self._card_chrome.clear()
+        self._card_chrome[key] = (chrome, mask)
+        return chrome, mask
+
     def _draw_weather_card(
         self,
+        image: Image.Image,
         draw: ImageDraw.Draw,
         box: Tuple[int, int, int, int],
+        now: datetime,
         top_pad: int = 0,
         invert: bool = False,
     ) -> None:
+        if self.latitude is None or self.longitude is None:
+            # No location configured: there will never be anything to show.
+            return
+
         x0, y0, x1, y1 = self._inset_box(box, 12)
         if top_pad:
             y0 = max(y0, y0 + top_pad)
-        bg_fill = 0 if invert else None
+
+        weather = self.weather
+        if weather.get("current") is None and weather.get("high") is None and weather.get("low") is None:
+            # Nothing fetched yet: one placeholder line instead of a card of "--".
+            draw.text(
+                ((x0 + x1) // 2, (y0 + y1) // 2),
+                "Weather unavailable",
+                font=self.fonts.get("default"),
+                fill=0,
+                anchor="mm",
+            )
+            return
+
         text_fill = 255 if invert else 0
-        draw.rounded_rectangle([(x0, y0), (x1, y1)], radius=16, outline=0, width=2, fill=bg_fill)
+        chrome, mask = self._weather_chrome(x1 - x0, y1 - y0, invert)
+        image.paste(chrome, (x0, y0), mask)
 
         label_font = self.fonts.get("default")
         value_font = self.fonts.get("large", self.fonts.get("default"))
 
         temps = [
-            self._format_temperature(self.weather.get("current"), fallback="--"),
-            self._format_temperature(self.weather.get("high"), fallback="--"),
-            self._format_temperature(self.weather.get("low"), fallback="--"),
+            self._format_temperature(weather.get("current"), fallback="--"),
+            self._format_temperature(weather.get("high"), fallback="--"),
+            self._format_temperature(weather.get("low"), fallback="--"),
         ]
-        labels = ["Now", "High", "Low"]
 
         col_width = (x1 - x0) // 3
         col_centers = [x0 + col_width * i + col_width // 2 for i in range(3)]
-        content_top = y0 + 18
+        value_top = y0 + 18 + 8
 
-        for idx, (label, value) in enumerate(zip(labels, temps)):
-            lw, lh = self._get_text_size(draw, label, label_font)
+        for idx, (label, value) in enumerate(zip(_WEATHER_LABELS, temps)):
+            _, lh = self._get_text_size(draw, label, label_font)
             vw, vh = self._get_text_size(draw, value, value_font)
-            cx = col_centers[idx]
-            draw.text((cx - lw // 2, content_top), label, font=label_font, fill=text_fill)
-            draw.text((cx - vw // 2, content_top + lh + 8), value, font=value_font, fill=text_fill)
-
-        draw.line([(x0 + col_width, y0 + 10), (x0 + col_width, y1 - 10)], fill=text_fill, width=1)
-        draw.line([(x0 + 2 * col_width, y0 + 10), (x0 + 2 * col_width, y1 - 10)], fill=text_fill, width=1)
+            draw.text((col_centers[idx] - vw // 2, value_top + lh), value, font=value_font, fill=text_fill)
 
         if self.last_weather_fetch:
-            age = datetime.now() - self.last_weather_fetch
-            minutes = int(age.total_seconds() // 60)
+            minutes = int((now - self.last_weather_fetch).total_seconds() // 60)
             updated_text = f"Updated {minutes}m ago"
             footer_font = self.fonts.get("small", label_font)
             fw, fh = self._get_text_size(draw, updated_text, footer_font)
             draw.text((x1 - fw - 10, y1 - fh - 8), updated_text, font=footer_font, fill=text_fill)
 
+    def _blank_canvas(self, width: int, height: int) -> Image.Image:
+        canvas = self._canvas
+        if canvas is None or canvas.size != (width, height):
+            canvas = self._canvas = Image.new("1", (width, height), 255)
+        else:
+            canvas.paste(255, (0, 0, width, height))
+        return canvas
+
+    def _frame_state(self, layout: LayoutPreset, width: int, height: int, now: datetime) -> Tuple[Any, ...]:
+        """Everything that can change what a frame looks like."""
+        weather = self.weather
+        updated_minutes = None
+        if self.last_weather_fetch:
+            updated_minutes = int((now - self.last_weather_fetch).total_seconds() // 60)
+        return (
+            layout.name,
+            width,
+            height,
+            self._format_time(now),
+            self._format_date(now),
+            weather.get("current"),
+            weather.get("high"),
+            weather.get("low"),
+            updated_minutes,
+        )
+
     def render(self, width: int = 800, height: int = 480, **kwargs) -> Image.Image:
         layout = self._resolve_layout(kwargs.get("layout"))
+        now = datetime.now()
+
+        key = self._frame_state(layout, width, height, now)
+        if key == self._frame_key and self._frame is not None:
+            return self._frame
+
+        image = self._render_layout(layout, width, height, now)
+        self._frame = image
+        self._frame_key = key
+        return image
+
+    def _render_layout(self, layout: LayoutPreset, width: int, height: int, now: datetime) -> Image.Image:
         if layout.name == "full":
-            return self._render_full(width, height)
+            return self._render_full(width, height, now)
 
-        image = Image.new("1", (width, height), 255)
+        image = self._blank_canvas(width, height)
         draw = ImageDraw.Draw(image)
 
-        now = datetime.now()
         fallback_box = (0, 0, width, height)
         slots = self._layout_slots(layout, width, height)
         primary_box = self._pick_slot(slots, ("main", "primary", "row1_left", "top_left", "a"), fallback_box)
@@ -319,11 +427,11 @@ class Module:
         last_text_y = self._draw_time_card(draw, primary_box, now, header_text)
 
         if secondary_box:
-            self._draw_weather_card(draw, secondary_box, invert=layout.compact)
+            self._draw_weather_card(image, draw, secondary_box, now, invert=layout.compact)
         else:
             _, y0, x1, _ = primary_box
             weather_area = (primary_box[0], last_text_y + 18, x1, height - 10)
-            self._draw_weather_card(draw, weather_area, top_pad=0, invert=False)
+            self._draw_weather_card(image, draw, weather_area, now, top_pad=0, invert=False)
 
         return image
 
@@ -332,24 +440,85 @@ class Module:
             return
 
         now = datetime.now()
+        if self._next_weather_attempt is not None and now < self._next_weather_attempt:
+            return
         if self.last_weather_fetch is None or (now - self.last_weather_fetch) > timedelta(
             seconds=self.weather_refresh_seconds
         ):
+            self._start_background_fetch()
+
+    def _start_background_fetch(self) -> None:
+        with self._fetch_lock:
+            if self._fetch_inflight:
+                return
+            self._fetch_inflight = True
+        threading.Thread(target=self._fetch_in_background, name="clock-weather", daemon=True).start()
+
+    def _fetch_in_background(self) -> None:
+        try:
             self._fetch_weather()
-            self.last_weather_fetch = now
+        finally:
+            with self._fetch_lock:
+                self._fetch_inflight = False
 
     def force_refresh(self) -> None:
-        """Immediately fetch weather data regardless of the schedule."""
+        """Fetch weather data now regardless of the schedule.
+
+        Runs on the background fetch thread so retry backoff never blocks the
+        button handler; the next render picks up the result.
+        """
 
         if self.latitude is None or self.longitude is None:
             return
 
-        self._fetch_weather()
-        self.last_weather_fetch = datetime.now()
+        self._start_background_fetch()
 
-    def _fetch_weather(self) -> None:
+    def _weather_cache_file(self) -> Optional[Path]:
+        if self.latitude is None or self.longitude is None:
+            return None
+        try:
+            lat, lon = round(float(self.latitude), 3), round(float(self.longitude), 3)
+        except (TypeError, ValueError):
+            return None
+        return _CACHE_DIR / f"weather_{lat}_{lon}_{self._unit_api}.json"
+
+    def _load_weather_cache(self) -> None:
+        """Restore the last fetch if it is still within the refresh interval."""
+        path = self._weather_cache_path
+        if path is None:
+            return
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                cached = json.load(handle)
+            fetched = datetime.fromisoformat(cached["fetched"])
+            weather = cached["weather"]
+        except FileNotFoundError:
+            return
+        except Exception as exc:
+            self.log.debug("Ignoring weather cache %s: %s", path, exc)
+            return
+
+        if datetime.now() - fetched < timedelta(seconds=self.weather_refresh_seconds):
+            self.weather.update({key: weather.get(key) for key in ("current", "high", "low")})
+            self.last_weather_fetch = fetched
+
+    def _save_weather_cache(self, fetched: datetime) -> None:
+        path = self._weather_cache_path
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            with tmp.open("w", encoding="utf-8") as handle:
+                json.dump({"fetched": fetched.isoformat(), "weather": self.weather}, handle)
+            os.replace(tmp, path)
+        except OSError as exc:
+            self.log.debug("Could not write weather cache %s: %s", path, exc)
+
+    def _fetch_weather(self) -> bool:
+        """Fetch current weather, retrying transient errors with exponential backoff."""
         base_url = "https://api.open-meteo.com/v1/forecast"
-        unit = "fahrenheit" if str(self.temperature_unit).lower().startswith("f") else "celsius"
+        unit = self._unit_api
 
         params = {
             "latitude": self.latitude,
@@ -360,20 +529,47 @@ class Module:
             "temperature_unit": unit,
         }
 
+        payload = None
+        for attempt in range(_WEATHER_ATTEMPTS):
+            try:
+                response = self._session.get(base_url, params=params, timeout=5)
+                response.raise_for_status()
+                payload = response.json()
+                break
+            except (requests.RequestException, ValueError) as exc:
+                if attempt + 1 < _WEATHER_ATTEMPTS:
+                    time.sleep(_WEATHER_BACKOFF_SECONDS * 2**attempt)
+                    continue
+                self.log.warning("Weather fetch failed after %d attempts: %s", _WEATHER_ATTEMPTS, exc)
+                self._retry_weather_soon()
+                return False
+
         try:
-            response = requests.get(base_url, params=params, timeout=5)
-            response.raise_for_status()
-            payload = response.json()
             current_temp = payload.get("current", {}).get("temperature_2m")
             daily = payload.get("daily", {})
             highs = daily.get("temperature_2m_max") or []
             lows = daily.get("temperature_2m_min") or []
             high_temp = highs[0] if highs else None
             low_temp = lows[0] if lows else None
-
-            self.weather.update({"current": current_temp, "high": high_temp, "low": low_temp})
         except Exception as exc:
             self.log.warning("Weather fetch failed: %s", exc)
+            self._retry_weather_soon()
+            return False
+
+        fetched = datetime.now()
+        # Swap in a new dict so a concurrent render never sees a half update.
+        self.weather = {"current": current_temp, "high": high_temp, "low": low_temp}
+        self.last_weather_fetch = fetched
+        self._next_weather_attempt = None
+        self._save_weather_cache(fetched)
+        return True
+
+    def _retry_weather_soon(self) -> None:
+        """Schedule the next tick-driven fetch about a minute out, not a full interval.
+
+        ``last_weather_fetch`` is left alone: it still dates the data on screen.
+        """
+        self._next_weather_attempt = datetime.now() + timedelta(seconds=_WEATHER_RETRY_AFTER_SECONDS)
 
     def _format_temperature(self, value: Optional[float], fallback: str = "--") -> str:
         if value is None:
@@ -382,8 +578,7 @@ class Module:
             rounded = round(float(value))
         except (TypeError, ValueError):
             return fallback
-        unit_symbol = "°F" if str(self.temperature_unit).lower().startswith("f") else "°C"
-        return f"{rounded}{unit_symbol}"
+        return f"{rounded}{self._unit_symbol}"
 
     def handle_button(self, event: str) -> None:
         # Clock currently ignores button presses.
@@ -5,10 +5,10 @@ import logging
 from datetime import date
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
 from app.core.module_interface import BaseDisplayModule, DEFAULT_LAYOUTS, LayoutPreset
-from app.core.theme import OUTER_PAD, PAGE_HEADER_H, draw_page_header, fit_header_font
+from app.core.theme import OUTER_PAD, PAGE_HEADER_H, draw_page_header, fit_header_font, load_font
 
 log = logging.getLogger(__name__)
 
@@ -92,7 +92,7 @@ class Module(BaseDisplayModule):
     def _load_font(self, size: int) -> Any:
         path = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
         try:
-            return ImageFont.truetype(path, size)
+            return load_font(path, size)
         except Exception:
             return self.fonts.get("large", self.fonts.get("default"))
 
@@ -1,18 +1,114 @@
 # app/modules/mealie_today.py
 
 import datetime
+import functools
+import json
 import logging
+import re
 import textwrap
+import threading
+import time
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import requests
-from PIL import Image, ImageDraw, ImageFont
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from PIL import Image, ImageDraw
 
 from app.core.module_interface import DEFAULT_LAYOUTS, LayoutPreset
-from app.core.theme import OUTER_PAD, CARD_RADIUS, PAGE_HEADER_H, draw_page_header, fit_header_font
+from app.core.theme import OUTER_PAD, CARD_RADIUS, PAGE_HEADER_H, draw_page_header, fit_header_font, load_font, measure_text, wrap_text
 
 log = logging.getLogger(__name__)
 
+try:
+    import orjson  # type: ignore
+
+    _json_loads = orjson.loads
+except ImportError:
+    # Optional speedup only; the stdlib parser reads the same bytes.
+    _json_loads = json.loads
+
+# ISO8601 durations as Mealie emits them ("PT1H15M"), plus a looser pass for
+# odd ISO strings and free-form text like "1H 15M" or "45 min".
+_ISO_DURATION_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?")
+_ISO_PART_RE = re.compile(r"(\d+)([HMS])")
+_TEXT_PART_RE = re.compile(r"(\d+)\s*([HM]?)")
+
+# (connect, read): an unreachable server fails fast; a slow one gets longer.
+_HTTP_TIMEOUT = (2, 5)
+
+# Refresh back-off: after a few identical plans in a row the interval doubles
+# (up to 2**4), never past the cap (unless refresh_seconds itself is longer).
+# A failed fetch is retried after a short fixed delay instead, and a new day
+# always refetches.
+_MAX_BACKOFF_DOUBLINGS = 4
+_STABLE_FETCHES_BEFORE_BACKOFF = 3
+_MAX_REFRESH_SECONDS = 4 * 3600
+_FAILURE_RETRY_SECONDS = 60
+
+
+def _minutes_text(value: int) -> str:
+    hours, minutes = divmod(value, 60)
+    parts = []
+    if hours:
+        parts.append(f"{hours}h")
+    if minutes or not parts:
+        parts.append(f"{minutes}m")
+    return " ".join(parts)
+
+
+_TIME_LABELS = ("Prep", "Cook", "Total")
+# Accepted spellings of target_eat_time.
+_TARGET_TIME_FORMATS = ("%H:%M", "%I:%M %p", "%I:%M%p")
+
+# Slot names tried, in order, for each card of the preset layouts.
+_TITLE_SLOT_KEYS = ("main", "primary", "row1_left", "top_left", "a")
+_DETAILS_SLOT_KEYS = ("secondary", "row1_right", "top_right", "bottom_left", "bottom_right", "b", "c")
+_FOOTER_SLOT_KEYS = ("tertiary", "row2_left", "row2_center", "row2_right", "footer_left", "footer_right", "d", "e")
+
+# Labels for every duration up to 12 hours; recipes rarely go past that.
+_MINUTES_TEXT = tuple(_minutes_text(value) for value in range(12 * 60 + 1))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_duration_text(value: str, assume_hours_if_small: bool) -> Optional[int]:
+    """String half of ``Module._parse_duration_minutes``; recipe durations repeat, so memoized."""
+    stripped = value.strip().upper()
+    # Simple numeric string ("45")
+    if stripped.isdigit():
+        numeric_value = int(stripped)
+        if assume_hours_if_small and numeric_value <= 12:
+            return numeric_value * 60
+        return numeric_value
+
+    # ISO8601 duration (PT#H#M#S)
+    if stripped.startswith("PT"):
+        match = _ISO_DURATION_RE.fullmatch(stripped)
+        if match:
+            hours, minutes, seconds = match.groups()
+            minutes_total = int(hours or 0) * 60 + int(minutes or 0) + (1 if seconds and int(seconds) else 0)
+        else:
+            parts = {unit: int(num) for num, unit in _ISO_PART_RE.findall(stripped, 2)}
+            minutes_total = parts.get("H", 0) * 60 + parts.get("M", 0) + (1 if parts.get("S") else 0)
+        if assume_hours_if_small and minutes_total <= 12:
+            minutes_total *= 60
+        return minutes_total
+
+    # Formats like "45M", "1H 15M", "45 min", "1 hour 30 minutes"
+    total_minutes = 0
+    for num, unit in _TEXT_PART_RE.findall(stripped.replace("MIN", "M").replace("HOUR", "H")):
+        total_minutes += int(num) * 60 if unit == "H" else int(num)
+    if assume_hours_if_small and total_minutes and total_minutes <= 12:
+        total_minutes *= 60
+    return total_minutes or None
+
+
+@functools.lru_cache(maxsize=64)
+def _wrap_to_chars(text: str, width: int) -> Tuple[str, ...]:
+    """Word-wrap ``text`` to ``width`` characters (fallback for fonts without getlength)."""
+    return tuple(textwrap.TextWrapper(width=width).wrap(text))
+
+
 class Module:
     name = "mealie_today"
 
@@ -25,6 +121,10 @@ class Module:
 
         self.fonts = fonts
         self.last_fetch: Optional[datetime.datetime] = None
+        # Refresh gating without building a datetime per tick: the monotonic
+        # time of the last fetch, and the epoch time its day ends.
+        self._last_fetch_mono: Optional[float] = None
+        self._fetch_day_end = 0.0
         self.meal_details: Dict[str, Optional[Any]] = {
             "name": "You Effed up, Doordash",
             "prep": None,
@@ -32,8 +132,70 @@ class Module:
             "total": None,
         }
 
+        # Scheduled refreshes run on a background thread while render keeps
+        # serving the last known meal (stale-while-revalidate).
+        self._fetch_lock = threading.Lock()
+        self._fetch_inflight = False
+        self._consecutive_failures = 0
+        self._stable_fetches = 0
+        # Scheduled refreshes wait until the last result has actually been shown.
+        self._rendered_since_fetch = False
+
+        # One kept-alive connection to the (fixed) Mealie server, with the auth
+        # headers set once instead of per request.
+        self._session = requests.Session()
+        self._session.headers.update(
+            {
+                "Authorization": f"Bearer {self.api_token}",
+                "Accept": "application/json",
+            }
+        )
+        self._mealplan_url = f"{self.base_url}/api/households/mealplans/today"
+        # Conditional headers built from the last full response's validators;
+        # an unchanged plan comes back as a bodiless 304 and the cached entries
+        # are reused.
+        self._validators: Dict[str, str] = {}
+        self._cached_entries: Optional[List[Dict[str, Any]]] = None
+        # A dropped keep-alive socket or a brief network blip is retried in place
+        # instead of waiting out a whole backoff period.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=2,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
         self._default_layout = DEFAULT_LAYOUTS[0]
         self._layout_lookup = {layout.name: layout for layout in DEFAULT_LAYOUTS}
+        # Pixel slot boxes per (layout name, width, height); geometry never changes.
+        self._slot_cache: Dict[Tuple[str, int, int], Dict[str, Tuple[int, int, int, int]]] = {}
+        # (title, details, footer) boxes picked from those slots, same key.
+        self._resolved_boxes: Dict[Tuple[str, int, int], Tuple[Any, Any, Any]] = {}
+        # Parsed once; target_eat_time is fixed config.
+        self._target_time = self._parse_target_time()
+        self._strip_hour_zero = self.time_format.startswith("%I")
+        # (date, target datetime, target label) for the current day.
+        self._target_cache: Optional[Tuple[datetime.date, datetime.datetime, str]] = None
+
+        # Last rendered frame and the visible state it was drawn from.
+        self._frame: Optional[Image.Image] = None
+        self._frame_key: Optional[Tuple[Any, ...]] = None
+        # Single 1-bit canvas reused (and cleared) for every render. The display
+        # copies frames before drawing on them, so handing it out is safe.
+        self._canvas: Optional[Image.Image] = None
+        # Meal-independent layer (header, title card chrome) per (layout, width, height).
+        self._static_layers: Dict[Tuple[str, int, int], Tuple[Image.Image, int]] = {}
+        # Time card outline, labels and separators per (width, height, invert),
+        # pasted through a mask of their own ink.
+        self._card_chrome: Dict[Tuple[int, int, bool], Tuple[Image.Image, Image.Image, Tuple[Tuple[int, int], ...]]] = {}
+        # _fit_text_lines results per (font path, start size, text, box, min size, spacing).
+        self._fit_cache: Dict[Tuple[Any, ...], Tuple[Any, List[str], int]] = {}
 
     # ------------------------
     # Data Fetching Logic
@@ -42,19 +204,32 @@ class Module:
         if not self.base_url or not self.api_token:
             return None
 
-        url = f"{self.base_url}/api/households/mealplans/today"
-        headers = {
-            "Authorization": f"Bearer {self.api_token}",
-            "Accept": "application/json",
-        }
-
         try:
-            resp = requests.get(url, headers=headers, timeout=5)
+            resp = self._session.get(self._mealplan_url, headers=self._validators, timeout=_HTTP_TIMEOUT)
+            if resp.status_code == 304:
+                self._consecutive_failures = 0
+                return self._cached_entries
             resp.raise_for_status()
-            return resp.json()
-        except Exception as e:
+            entries = _json_loads(resp.content)
+            self._consecutive_failures = 0
+            validators = {}
+            etag = resp.headers.get("ETag")
+            if etag:
+                validators["If-None-Match"] = etag
+            last_modified = resp.headers.get("Last-Modified")
+            if last_modified:
+                validators["If-Modified-Since"] = last_modified
+            self._cached_entries = entries
+            self._validators = validators
+            return entries
+        except requests.HTTPError as e:
+            log.warning("Mealie fetch failed: HTTP %s", e.response.status_code if e.response is not None else "?")
+        except requests.RequestException as e:
             log.warning("Mealie fetch error: %s", e)
-            return None
+        except ValueError as e:
+            log.warning("Mealie returned invalid JSON: %s", e)
+        self._consecutive_failures += 1
+        return None
 
     def _parse_duration_minutes(
         self, value: Any, *, assume_hours_if_small: bool = False
@@ -80,50 +255,7 @@ class Module:
             return numeric_value
 
         if isinstance(value, str):
-            stripped = value.strip().upper()
-            # Simple numeric string ("45")
-            if stripped.isdigit():
-                numeric_value = int(stripped)
-                if assume_hours_if_small and numeric_value <= 12:
-                    return numeric_value * 60
-                return numeric_value
-
-            # ISO8601 duration (PT#H#M#S)
-            if stripped.startswith("PT"):
-                hours = minutes = seconds = 0
-                num = ""
-                for char in stripped[2:]:
-                    if char.isdigit():
-                        num += char
-                        continue
-                    if char == "H":
-                        hours = int(num or 0)
-                        num = ""
-                    elif char == "M":
-                        minutes = int(num or 0)
-                        num = ""
-                    elif char == "S":
-                        seconds = int(num or 0)
-                        num = ""
-                minutes_total = hours * 60 + minutes + (1 if seconds else 0)
-                if assume_hours_if_small and minutes_total <= 12:
-                    minutes_total *= 60
-                return minutes_total
-
-            # Formats like "45M", "1H 15M", "45 min"
-            total_minutes = 0
-            segments = stripped.replace("MIN", "M").replace("HOUR", "H").split()
-            for segment in segments:
-                num = "".join(ch for ch in segment if ch.isdigit())
-                if not num:
-                    continue
-                if segment.endswith("H"):
-                    total_minutes += int(num) * 60
-                else:
-                    total_minutes += int(num)
-            if assume_hours_if_small and total_minutes and total_minutes <= 12:
-                total_minutes *= 60
-            return total_minutes or None
+            return _parse_duration_text(value, assume_hours_if_small)
 
         return None
 
@@ -131,67 +263,117 @@ class Module:
         if not isinstance(entries, list):
             return None
 
-        for entry in entries:
-            if entry.get("entryType") == "dinner":
-                recipe = entry.get("recipe") or {}
-                prep = self._parse_duration_minutes(recipe.get("prepTime"))
-
-                cook_source = recipe.get("cookTime") or recipe.get("performTime")
-                cook = self._parse_duration_minutes(
-                    cook_source,
-                    assume_hours_if_small=True,
-                )
-                total = self._parse_duration_minutes(
-                    recipe.get("totalTime"), assume_hours_if_small=True
-                )
-
-                if cook is not None:
-                    prep_minutes = prep or 0
-
-                    # When cook time is assumed to be in hours (e.g., "2" -> 2h),
-                    # prefer a total that at least includes that corrected value.
-                    if total is None:
-                        total = prep_minutes + cook
-                    elif total < cook:
-                        total = prep_minutes + cook
-
-                return {
-                    "name": recipe.get("name") or entry.get("title"),
-                    "prep": prep,
-                    "cook": cook,
-                    "total": total,
-                }
-        return None
+        entry = next(
+            (e for e in entries if isinstance(e, dict) and e.get("entryType") == "dinner"),
+            None,
+        )
+        if entry is None:
+            return None
+
+        recipe = entry.get("recipe") or {}
+        get = recipe.get
+        parse = self._parse_duration_minutes
+        prep = parse(get("prepTime"))
+        cook = parse(get("cookTime") or get("performTime"), assume_hours_if_small=True)
+        total = parse(get("totalTime"), assume_hours_if_small=True)
+
+        if cook is not None:
+            prep_minutes = prep or 0
+
+            # When cook time is assumed to be in hours (e.g., "2" -> 2h),
+            # prefer a total that at least includes that corrected value.
+            if total is None:
+                total = prep_minutes + cook
+            elif total < cook:
+                total = prep_minutes + cook
+
+        return {
+            "name": get("name") or entry.get("title"),
+            "prep": prep,
+            "cook": cook,
+            "total": total,
+        }
 
     def tick(self) -> None:
         """Background task to fetch data occasionally."""
-        now = datetime.datetime.now()
-
-        if self.last_fetch is None or (now - self.last_fetch).total_seconds() > self.refresh_seconds:
-            entries = self._fetch_today_mealplan()
-            if entries:
-                dinner = self._extract_dinner_details(entries)
-                if dinner:
-                    self.meal_details = {
-                        "name": dinner.get("name") or "You Effed up, Doordash",
-                        "prep": dinner.get("prep"),
-                        "cook": dinner.get("cook"),
-                        "total": dinner.get("total"),
-                    }
-                else:
-                    self.meal_details = {
-                        "name": "You Effed up, Doordash",
-                        "prep": None,
-                        "cook": None,
-                        "total": None,
-                    }
-            self.last_fetch = now
+        if self._refresh_due():
+            self._start_background_refresh()
+
+    def _start_background_refresh(self) -> None:
+        with self._fetch_lock:
+            if self._fetch_inflight:
+                return
+            self._fetch_inflight = True
+        threading.Thread(
+            target=self._refresh_in_background,
+            args=(datetime.datetime.now(), time.monotonic()),
+            name="mealie-refresh",
+            daemon=True,
+        ).start()
+
+    def _refresh_due(self) -> bool:
+        last = self._last_fetch_mono
+        if last is None or time.time() >= self._fetch_day_end:
+            return True
+        elapsed = time.monotonic() - last
+        if self._consecutive_failures:
+            # Don't leave an outage on screen; retry whether or not it was shown.
+            return elapsed > _FAILURE_RETRY_SECONDS
+        if not self._rendered_since_fetch:
+            return False
+        return elapsed > self._effective_refresh_seconds()
+
+    def _effective_refresh_seconds(self) -> float:
+        base = self.refresh_seconds
+        extra = self._stable_fetches - _STABLE_FETCHES_BEFORE_BACKOFF + 1
+        if extra > 0:
+            return min(base * 2 ** min(extra, _MAX_BACKOFF_DOUBLINGS), max(base, _MAX_REFRESH_SECONDS))
+        return base
+
+    def _refresh_in_background(self, started: datetime.datetime, started_mono: float) -> None:
+        try:
+            self._refresh(started, started_mono)
+        finally:
+            with self._fetch_lock:
+                self._fetch_inflight = False
+
+    def _refresh(self, started: datetime.datetime, started_mono: float) -> None:
+        """Fetch today's plan; ``meal_details`` is only replaced on a usable response."""
+        entries = self._fetch_today_mealplan()
+        if entries:
+            dinner = self._extract_dinner_details(entries)
+            if dinner:
+                details = {
+                    "name": dinner.get("name") or "You Effed up, Doordash",
+                    "prep": dinner.get("prep"),
+                    "cook": dinner.get("cook"),
+                    "total": dinner.get("total"),
+                }
+            else:
+                details = {
+                    "name": "You Effed up, Doordash",
+                    "prep": None,
+                    "cook": None,
+                    "total": None,
+                }
+            self._stable_fetches = self._stable_fetches + 1 if details == self.meal_details else 0
+            # Swap in a new dict so a concurrent render never sees a half update.
+            self.meal_details = details
+        self.last_fetch = started
+        self._fetch_day_end = datetime.datetime.combine(
+            started.date() + datetime.timedelta(days=1), datetime.time()
+        ).timestamp()
+        self._last_fetch_mono = started_mono
+        self._rendered_since_fetch = False
 
     def force_refresh(self) -> None:
-        """Immediately fetch the latest meal plan data."""
+        """Fetch the latest meal plan data now, regardless of the schedule.
+
+        Runs on the background refresh thread (joining one already in flight)
+        so HTTP timeouts never block the button handler.
+        """
 
-        self.last_fetch = None
-        self.tick()
+        self._start_background_refresh()
 
     def handle_button(self, event: str) -> None:
         # Action handling is not yet implemented for this module.
@@ -213,27 +395,30 @@ class Module:
     # ------------------------
     def _get_text_size(self, draw: ImageDraw.Draw, text: str, font: Any) -> Tuple[int, int]:
         """Compatible text size calculator for new and old Pillow versions."""
-        try:
-            left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
-            return right - left, bottom - top
-        except AttributeError:
-            return draw.textsize(text, font=font)
+        return measure_text(draw, text, font)
 
     def _resize_font(self, font: Any, size: int) -> Any:
-        """Return a resized version of the provided font when possible."""
+        """Return a resized version of the provided font when possible.
 
-        try:
-            return font.font_variant(size=size)
-        except Exception:
-            pass
+        File-backed fonts come from the shared per-(path, size) cache, so the
+        size search in _fit_text_lines reuses one face per size across renders
+        (and keeps their measured text sizes warm).
+        """
+        if getattr(font, "size", None) == size:
+            return font
 
         font_path = getattr(font, "path", None)
-        if font_path:
+        if isinstance(font_path, str):
             try:
-                return ImageFont.truetype(font_path, size)
+                return load_font(font_path, size)
             except Exception:
                 pass
 
+        try:
+            return font.font_variant(size=size)
+        except Exception:
+            pass
+
         return font
 
     def _fit_text_lines(
@@ -254,6 +439,34 @@ class Module:
 
         start_size = getattr(base_font, "size", None) or 24
 
+        # The size search is linear on purpose: wrap points jump as the size
+        # changes, so "fits" is not monotonic and bisecting could pick a
+        # different size. Instead the whole result is kept per input.
+        path = getattr(base_font, "path", None)
+        key = (path, start_size, text, max_width, max_height, min_size, line_spacing) if path else None
+        fitted = self._fit_cache.get(key) if key else None
+        if fitted is None:
+            fitted = self._search_text_fit(
+                draw, text, base_font, start_size, max_width, max_height, min_size, line_spacing
+            )
+            if key:
+                if len(self._fit_cache) >= 64:
+                    self._fit_cache.clear()
+                self._fit_cache[key] = fitted
+        font, lines, total_height = fitted
+        return font, list(lines), total_height
+
+    def _search_text_fit(
+        self,
+        draw: ImageDraw.Draw,
+        text: str,
+        base_font: Any,
+        start_size: int,
+        max_width: int,
+        max_height: int,
+        min_size: int,
+        line_spacing: int,
+    ) -> Tuple[Any, List[str], int]:
         for size in range(start_size, min_size - 1, -2):
             font = self._resize_font(base_font, size)
             lines = self._wrap_text(draw, text, font, max_width)
@@ -282,45 +495,71 @@ class Module:
 
         return fallback_font, lines, total_height
 
-    def _render_full(self, width: int, height: int) -> Image.Image:
+    def _render_full(self, width: int, height: int, meal: Dict[str, Any]) -> Image.Image:
         """Classic full-screen layout prior to the preset system."""
-        image = Image.new("1", (width, height), 255)
-        draw = ImageDraw.Draw(image)
-
-        # Page header — "Tonight's Dinner" in the standard pill bar
-        draw_page_header(draw, width, "Tonight's Dinner", fit_header_font(draw, "Tonight's Dinner", width))
-
         padding = OUTER_PAD
         body_top = PAGE_HEADER_H + padding
         available_h = height - body_top - padding
         header_bottom = body_top + int(available_h * 0.45)
 
         title_box = (padding, body_top, width - padding, header_bottom)
-        meal_text = str(self.meal_details.get("name") or "You Effed up, Doordash")
-        bottom_of_title = self._draw_title_card(draw, title_box, meal_text, show_label=False)
+        base, meal_area_top = self._static_layer("full", width, height, title_box)
+        image = self._blank_canvas(width, height, base)
+        draw = ImageDraw.Draw(image)
+
+        meal_text = str(meal.get("name") or "You Effed up, Doordash")
+        times = self._time_values(meal)
+        bottom_of_title = self._draw_title_card(draw, title_box, meal_text, meal_area_top)
 
         time_box_top = bottom_of_title + 10
         time_box_bottom = min(height - 90, time_box_top + 200)
         if time_box_bottom <= time_box_top:
             time_box_bottom = time_box_top + 120
         time_box = (padding, time_box_top, width - padding, time_box_bottom)
-        self._draw_time_card(draw, time_box)
-
-        start_by = self._compute_start_time(self.meal_details.get("total"))
-        target_time = self._parse_target_time()
-        target_str = datetime.datetime.combine(datetime.date.today(), target_time)
-        target_label = self._format_clock(target_str)
-
-        if start_by:
-            banner_text = f"Start by {self._format_clock(start_by)} to eat by {target_label}"
-        else:
-            banner_text = f"Plan to eat by {target_label}"
+        self._draw_time_card(image, draw, time_box, times)
 
+        banner_text = self._banner_text(meal.get("total"))
         banner_box = (padding, height - 80, width - padding, height - padding)
         self._draw_banner(draw, banner_box, banner_text)
 
         return image
 
+    def _blank_canvas(self, width: int, height: int, base: Optional[Image.Image] = None) -> Image.Image:
+        """Return the shared canvas, cleared to white or to a copy of ``base``."""
+        canvas = self._canvas
+        if canvas is None or canvas.size != (width, height):
+            canvas = self._canvas = Image.new("1", (width, height), 255)
+            if base is not None:
+                canvas.paste(base)
+        else:
+            canvas.paste(base if base is not None else 255, (0, 0, width, height))
+        return canvas
+
+    def _static_layer(
+        self, layout_name: str, width: int, height: int, title_box: Tuple[int, int, int, int]
+    ) -> Tuple[Image.Image, int]:
+        """Everything that never depends on the meal: page header, title card chrome.
+
+        Cached per (layout, width, height) with the meal text area's top edge.
+        """
+        key = (layout_name, width, height)
+        cached = self._static_layers.get(key)
+        if cached is not None:
+            return cached
+
+        layer = Image.new("1", (width, height), 255)
+        draw = ImageDraw.Draw(layer)
+        full = layout_name == "full"
+        if full:
+            # Page header — "Tonight's Dinner" in the standard pill bar
+            draw_page_header(draw, width, "Tonight's Dinner", fit_header_font(draw, "Tonight's Dinner", width))
+        meal_area_top = self._draw_title_chrome(draw, title_box, show_label=not full)
+
+        if len(self._static_layers) >= 8:
+            self._static_layers.clear()
+        cached = self._static_layers[key] = (layer, meal_area_top)
+        return cached
+
     def _resolve_layout(self, layout_hint: Optional[Any]) -> LayoutPreset:
         if isinstance(layout_hint, LayoutPreset):
             return layout_hint
@@ -328,40 +567,12 @@ class Module:
             return self._layout_lookup.get(layout_hint, self._default_layout)
         return self._default_layout
 
-    def _find_first_fit(self, columns: int, rows: int, colspan: int, rowspan: int, occupied: list[list[bool]]) -> Optional[Tuple[int, int]]:
-        for row in range(rows):
-            for col in range(columns):
-                if row + rowspan > rows or col + colspan > columns:
-                    continue
-                if any(
-                    occupied[r][c]
-                    for r in range(row, row + rowspan)
-                    for c in range(col, col + colspan)
-                ):
-                    continue
-                for r in range(row, row + rowspan):
-                    for c in range(col, col + colspan):
-                        occupied[r][c] = True
-                return col, row
-        return None
-
     def _layout_slots(self, layout: LayoutPreset, width: int, height: int) -> Dict[str, Tuple[int, int, int, int]]:
-        cell_w = width / layout.columns
-        cell_h = height / layout.rows
-        occupied = [[False for _ in range(layout.columns)] for _ in range(layout.rows)]
-        slots: Dict[str, Tuple[int, int, int, int]] = {}
-
-        for slot in layout.slots:
-            start = self._find_first_fit(layout.columns, layout.rows, slot.colspan, slot.rowspan, occupied)
-            if start is None:
-                continue
-            col, row = start
-            x0 = int(round(col * cell_w))
-            y0 = int(round(row * cell_h))
-            x1 = int(round((col + slot.colspan) * cell_w))
-            y1 = int(round((row + slot.rowspan) * cell_h))
-            slots[slot.key] = (x0, y0, x1, y1)
-
+        # Placement is precomputed on the preset (bitmask first-fit); only scale it.
+        key = (layout.name, width, height)
+        slots = self._slot_cache.get(key)
+        if slots is None:
+            slots = self._slot_cache[key] = layout.slot_boxes(width, height)
         return slots
 
     def _inset_box(self, box: Tuple[int, int, int, int], padding: int) -> Tuple[int, int, int, int]:
@@ -376,19 +587,18 @@ class Module:
 
     def _wrap_text(self, draw: ImageDraw.Draw, text: str, font: Any, max_width: int) -> List[str]:
         """Wrap text to fit within max_width pixels."""
-        try:
-            avg_width = font.size * 0.6
-        except AttributeError:
-            avg_width = 20
-
-        approx_chars = int(max_width / avg_width)
-        wrapper = textwrap.TextWrapper(width=approx_chars)
-        return wrapper.wrap(text)
+        if not hasattr(font, "getlength"):
+            # Older Pillow: estimate from the font size and wrap by characters.
+            try:
+                avg_width = font.size * 0.6
+            except AttributeError:
+                avg_width = 20
+            return list(_wrap_to_chars(text, int(max_width / avg_width)))
+        return wrap_text(text, font, max_width)
 
     def _parse_target_time(self) -> datetime.time:
         """Return configured target eat time, defaulting to 18:30 when parsing fails."""
-        candidates = ["%H:%M", "%I:%M %p", "%I:%M%p"]
-        for fmt in candidates:
+        for fmt in _TARGET_TIME_FORMATS:
             try:
                 return datetime.datetime.strptime(self.target_eat_time, fmt).time()
             except ValueError:
@@ -398,13 +608,10 @@ class Module:
     def _format_minutes(self, value: Optional[int]) -> str:
         if value is None:
             return "--"
-        hours, minutes = divmod(int(value), 60)
-        parts = []
-        if hours:
-            parts.append(f"{hours}h")
-        if minutes or not parts:
-            parts.append(f"{minutes}m")
-        return " ".join(parts)
+        value = int(value)
+        if 0 <= value < len(_MINUTES_TEXT):
+            return _MINUTES_TEXT[value]
+        return _minutes_text(value)
 
     def _compute_start_time(self, total_minutes: Optional[Any]) -> Optional[datetime.datetime]:
         parsed_total = self._parse_duration_minutes(
@@ -414,50 +621,67 @@ class Module:
         if parsed_total is None:
             return None
 
-        target_time = self._parse_target_time()
-        today = datetime.datetime.now().date()
-        target_dt = datetime.datetime.combine(today, target_time)
+        target_dt, _ = self._target_today()
         return target_dt - datetime.timedelta(minutes=parsed_total)
 
+    def _target_today(self) -> Tuple[datetime.datetime, str]:
+        """Today's target eat time and its label, rebuilt only when the date changes."""
+        today = datetime.date.today()
+        cached = self._target_cache
+        if cached is None or cached[0] != today:
+            target_dt = datetime.datetime.combine(today, self._target_time)
+            cached = self._target_cache = (today, target_dt, self._format_clock(target_dt))
+        return cached[1], cached[2]
+
     def _format_clock(self, dt_obj: datetime.datetime) -> str:
         result = dt_obj.strftime(self.time_format)
         # Strip leading zero from hour only for 12-hour format (01:30 PM → 1:30 PM)
-        if self.time_format.startswith("%I"):
+        if self._strip_hour_zero:
             result = result.lstrip("0")
         return result
 
-    def _draw_title_card(self, draw: ImageDraw.Draw, box: Tuple[int, int, int, int], meal_text: str, *, show_label: bool = True) -> int:
+    def _draw_title_chrome(self, draw: ImageDraw.Draw, box: Tuple[int, int, int, int], *, show_label: bool = True) -> int:
+        """Draw the title card outline (and label); return the top of the meal text area."""
         x0, y0, x1, y1 = self._inset_box(box, 12)
         draw.rounded_rectangle([(x0, y0), (x1, y1)], radius=CARD_RADIUS, outline=0, width=2)
 
+        inner_padding = 14
+        content_x0 = x0 + inner_padding
+        content_x1 = x1 - inner_padding
+        content_y0 = y0 + inner_padding
+
+        if not show_label:
+            return content_y0
+
+        header_text = "Tonight's Dinner"
+        base_header_font = self.fonts.get("large", self.fonts.get("default"))
+        header_max_height = max(int((y1 - y0) * 0.25), 32)
+        header_font, header_lines, header_height = self._fit_text_lines(
+            draw,
+            header_text,
+            base_header_font,
+            content_x1 - content_x0,
+            header_max_height,
+            min_size=18,
+            line_spacing=4,
+        )
+        header_line = header_lines[0] if header_lines else ""
+        hw, hh = self._get_text_size(draw, header_line, header_font)
+        draw.text(((content_x0 + content_x1 - hw) // 2, content_y0), header_line, font=header_font, fill=0)
+        return content_y0 + header_height + 14
+
+    def _draw_title_card(
+        self, draw: ImageDraw.Draw, box: Tuple[int, int, int, int], meal_text: str, meal_area_top: int
+    ) -> int:
+        """Draw the meal name inside a title card whose chrome is already drawn."""
+        x0, y0, x1, y1 = self._inset_box(box, 12)
         base_meal_font = self.fonts.get("large", self.fonts.get("default"))
 
         inner_padding = 14
         content_x0 = x0 + inner_padding
         content_x1 = x1 - inner_padding
-        content_y0 = y0 + inner_padding
         content_y1 = y1 - inner_padding
 
-        if show_label:
-            header_text = "Tonight's Dinner"
-            base_header_font = self.fonts.get("large", self.fonts.get("default"))
-            header_max_height = max(int((y1 - y0) * 0.25), 32)
-            header_font, header_lines, header_height = self._fit_text_lines(
-                draw,
-                header_text,
-                base_header_font,
-                content_x1 - content_x0,
-                header_max_height,
-                min_size=18,
-                line_spacing=4,
-            )
-            header_line = header_lines[0] if header_lines else ""
-            hw, hh = self._get_text_size(draw, header_line, header_font)
-            draw.text(((content_x0 + content_x1 - hw) // 2, content_y0), header_line, font=header_font, fill=0)
-            meal_area_top = content_y0 + header_height + 14
-        else:
-            meal_area_top = content_y0
-
         meal_area_height = max(content_y1 - meal_area_top, 20)
 
         meal_font, meal_lines, meal_block_height = self._fit_text_lines(
@@ -478,35 +702,76 @@ class Module:
 
         return current_y
 
-    def _draw_time_card(self, draw: ImageDraw.Draw, box: Tuple[int, int, int, int], invert: bool = False) -> None:
-        x0, y0, x1, y1 = self._inset_box(box, 12)
-        bg_fill = 0 if invert else None
-        text_fill = 255 if invert else 0
-
-        draw.rounded_rectangle([(x0, y0), (x1, y1)], radius=16, outline=0, width=2, fill=bg_fill)
+    def _time_card_chrome(
+        self, width: int, height: int, invert: bool
+    ) -> Tuple[Image.Image, Image.Image, Tuple[Tuple[int, int], ...]]:
+        """Return ``(chrome, mask, value_anchors)`` for a ``width`` x ``height`` time card.
 
+        The chrome holds the outline, column labels and separators; only the
+        three values are drawn per frame, centred on the card-relative
+        ``(x, y)`` anchors measured here along with the labels.
+        """
+        key = (width, height, invert)
+        cached = self._card_chrome.get(key)
+        if cached is not None:
+            return cached
+
+        size = (width + 1, height + 1)
+        chrome = Image.new("1", size, 255)
+        mask = Image.new("1", size, 0)
         label_font = self.fonts.get("default")
-        value_font = self.fonts.get("large", self.fonts.get("default"))
-
-        prep_text = self._format_minutes(self.meal_details.get("prep"))
-        cook_text = self._format_minutes(self.meal_details.get("cook"))
-        total_text = self._format_minutes(self.meal_details.get("total"))
-
-        col_width = (x1 - x0) // 3
-        col_centers = [x0 + col_width * i + col_width // 2 for i in range(3)]
-        labels = ["Prep", "Cook", "Total"]
-        values = [prep_text, cook_text, total_text]
-
-        top = y0 + 20
-        for idx, (label, value) in enumerate(zip(labels, values)):
-            lw, lh = self._get_text_size(draw, label, label_font)
-            vw, vh = self._get_text_size(draw, value, value_font)
-            cx = col_centers[idx]
-            draw.text((cx - lw // 2, top), label, font=label_font, fill=text_fill)
-            draw.text((cx - vw // 2, top + lh + 10), value, font=value_font, fill=text_fill)
+        col_width = width // 3
+        text_fill = 255 if invert else 0
+        anchors = []
+        for target, ink, text_ink in ((chrome, 0, text_fill), (mask, 1, 1)):
+            d = ImageDraw.Draw(target)
+            d.rounded_rectangle(
+                [(0, 0), (width, height)], radius=16, outline=ink, width=2, fill=ink if invert else None
+            )
+            anchors = []
+            for idx, label in enumerate(_TIME_LABELS):
+                lw, lh = self._get_text_size(d, label, label_font)
+                cx = col_width * idx + col_width // 2
+                d.text((cx - lw // 2, 20), label, font=label_font, fill=text_ink)
+                anchors.append((cx, 20 + lh + 10))
+            d.line([(col_width, 12), (col_width, height - 12)], fill=text_ink, width=1)
+            d.line([(2 * col_width, 12), (2 * col_width, height - 12)], fill=text_ink, width=1)
+
+        if len(self._card_chrome) >= 8:
+            self._card_chrome.clear()
+        cached = self._card_chrome[key] = (chrome, mask, tuple(anchors))
+        return cached
+
+    def _draw_time_card(
+        self,
+        image: Image.Image,
+        draw: ImageDraw.Draw,
+        box: Tuple[int, int, int, int],
+        values: Tuple[str, str, str],
+        invert: bool = False,
+    ) -> None:
+        """Draw the prep/cook/total card; ``values`` are the formatted durations."""
+        x0, y0, x1, y1 = self._inset_box(box, 12)
+        chrome, mask, anchors = self._time_card_chrome(x1 - x0, y1 - y0, invert)
+        image.paste(chrome, (x0, y0), mask)
 
-        draw.line([(x0 + col_width, y0 + 12), (x0 + col_width, y1 - 12)], fill=text_fill, width=1)
-        draw.line([(x0 + 2 * col_width, y0 + 12), (x0 + 2 * col_width, y1 - 12)], fill=text_fill, width=1)
+        text_fill = 255 if invert else 0
+        value_font = self.fonts.get("large", self.fonts.get("default"))
+        # Widths come from the per-font cache; label metrics were taken with the chrome.
+        widths = [self._get_text_size(draw, value, value_font)[0] for value in values]
+        for (cx, vy), value, vw in zip(anchors, values, widths):
+            draw.text((x0 + cx - vw // 2, y0 + vy), value, font=value_font, fill=text_fill)
+
+    def _time_values(self, meal: Dict[str, Any]) -> Tuple[str, str, str]:
+        fmt = self._format_minutes
+        return fmt(meal.get("prep")), fmt(meal.get("cook")), fmt(meal.get("total"))
+
+    def _banner_text(self, total: Optional[int]) -> str:
+        start_by = self._compute_start_time(total)
+        _, target_label = self._target_today()
+        if start_by:
+            return f"Start by {self._format_clock(start_by)} to eat by {target_label}"
+        return f"Plan to eat by {target_label}"
 
     def _draw_banner(self, draw: ImageDraw.Draw, box: Tuple[int, int, int, int], text: str) -> None:
         x0, y0, x1, y1 = self._inset_box(box, 12)
@@ -530,49 +795,71 @@ class Module:
     # ------------------------
     # Main Render
     # ------------------------
+    def _frame_state(self, layout: LayoutPreset, width: int, height: int, meal: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Everything that can change what a frame looks like."""
+        return (
+            layout.name,
+            width,
+            height,
+            meal.get("name"),
+            meal.get("prep"),
+            meal.get("cook"),
+            meal.get("total"),
+            # The banner's start-by/eat-by times are anchored to today's date.
+            datetime.date.today(),
+        )
+
     def render(self, width: int = 800, height: int = 480, **kwargs) -> Image.Image:
+        self._rendered_since_fetch = True
         layout = self._resolve_layout(kwargs.get("layout"))
-        if layout.name == "full":
-            return self._render_full(width, height)
 
-        image = Image.new("1", (width, height), 255)
-        draw = ImageDraw.Draw(image)
+        # One snapshot per render: a background refresh may swap meal_details
+        # mid-frame, and the cache key must describe what was actually drawn.
+        meal = self.meal_details
+        key = self._frame_state(layout, width, height, meal)
+        if key == self._frame_key and self._frame is not None:
+            return self._frame
 
-        slots = self._layout_slots(layout, width, height)
-        fallback_box = (0, 0, width, height)
-        title_box = self._pick_slot(slots, ("main", "primary", "row1_left", "top_left", "a"), fallback_box)
-        details_box = None
-        footer_box = None
+        image = self._render_layout(layout, width, height, meal)
+        self._frame = image
+        self._frame_key = key
+        return image
 
-        for key in ("secondary", "row1_right", "top_right", "bottom_left", "bottom_right", "b", "c"):
-            if key in slots:
-                details_box = slots[key]
-                break
+    def _layout_boxes(
+        self, layout: LayoutPreset, width: int, height: int
+    ) -> Tuple[Tuple[int, int, int, int], Optional[Tuple[int, int, int, int]], Optional[Tuple[int, int, int, int]]]:
+        """Resolve the (title, details, footer) boxes once per layout and size."""
+        key = (layout.name, width, height)
+        boxes = self._resolved_boxes.get(key)
+        if boxes is None:
+            slots = self._layout_slots(layout, width, height)
+            title_box = self._pick_slot(slots, _TITLE_SLOT_KEYS, (0, 0, width, height))
+            details_box = next((slots[k] for k in _DETAILS_SLOT_KEYS if k in slots), None)
+            footer_box = next((slots[k] for k in _FOOTER_SLOT_KEYS if k in slots), None)
+            boxes = self._resolved_boxes[key] = (title_box, details_box, footer_box)
+        return boxes
+
+    def _render_layout(self, layout: LayoutPreset, width: int, height: int, meal: Dict[str, Any]) -> Image.Image:
+        if layout.name == "full":
+            return self._render_full(width, height, meal)
 
-        for key in ("tertiary", "row2_left", "row2_center", "row2_right", "footer_left", "footer_right", "d", "e"):
-            if key in slots:
-                footer_box = slots[key]
-                break
+        title_box, details_box, footer_box = self._layout_boxes(layout, width, height)
 
-        meal_text = str(self.meal_details.get("name") or "You Effed up, Doordash")
-        bottom_of_title = self._draw_title_card(draw, title_box, meal_text)
+        base, meal_area_top = self._static_layer(layout.name, width, height, title_box)
+        image = self._blank_canvas(width, height, base)
+        draw = ImageDraw.Draw(image)
+
+        meal_text = str(meal.get("name") or "You Effed up, Doordash")
+        times = self._time_values(meal)
+        bottom_of_title = self._draw_title_card(draw, title_box, meal_text, meal_area_top)
 
         if details_box:
-            self._draw_time_card(draw, details_box, invert=layout.compact)
+            self._draw_time_card(image, draw, details_box, times, invert=layout.compact)
         else:
             stacked_box = (title_box[0], bottom_of_title + 10, title_box[2], title_box[3])
-            self._draw_time_card(draw, stacked_box)
-
-        start_by = self._compute_start_time(self.meal_details.get("total"))
-        target_time = self._parse_target_time()
-        target_str = datetime.datetime.combine(datetime.date.today(), target_time)
-        target_label = self._format_clock(target_str)
-
-        if start_by:
-            banner_text = f"Start by {self._format_clock(start_by)} to eat by {target_label}"
-        else:
-            banner_text = f"Plan to eat by {target_label}"
+            self._draw_time_card(image, draw, stacked_box, times)
 
+        banner_text = self._banner_text(meal.get("total"))
         banner_area = footer_box or details_box or title_box
         self._draw_banner(draw, banner_area, banner_text)
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 import datetime as dt
 import logging
 import textwrap
+import time
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from PIL import Image, ImageDraw
@@ -11,7 +12,7 @@ from PIL import Image, ImageDraw
 from app.core.module_interface import BaseDisplayModule, DEFAULT_LAYOUTS, LayoutPreset
 from app.core.theme import (
     OUTER_PAD, INNER_PAD, COL_GAP, LINE_SPACING,
-    draw_card, draw_card_header,
+    draw_card, draw_card_header, measure_text, wrap_text,
 )
 from app.modules.ticktick_client import TaskItem, TickTickClient
 
@@ -39,11 +40,19 @@ class Module(BaseDisplayModule):
         self.tomorrow_tasks: List[TaskItem] = []
         self.today_overflow: int = 0
         self.tomorrow_overflow: int = 0
+        # Display lines for the tasks above, formatted once per fetch.
+        self.today_lines: List[str] = []
+        self.tomorrow_lines: List[str] = []
         self.last_fetch: Optional[dt.datetime] = None
+        # Monotonic time of the last fetch; gates refreshes without a datetime per tick.
+        self._last_fetch_mono: Optional[float] = None
         self.error_message: Optional[str] = None
 
         self._default_layout = DEFAULT_LAYOUTS[0]
         self._layout_lookup = {layout.name: layout for layout in DEFAULT_LAYOUTS}
+        # Card outlines and "Today"/"Tomorrow" headers per (width, height), with
+        # each card's box and the y where its task lines start.
+        self._chrome: Dict[Tuple[int, int], Tuple[Image.Image, Tuple[Tuple[Tuple[int, int, int, int], int], ...]]] = {}
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -52,21 +61,31 @@ class Module(BaseDisplayModule):
         return self.refresh_seconds
 
     def tick(self) -> None:
-        now = dt.datetime.now(self.client.timezone)
-        if self.last_fetch and (now - self.last_fetch).total_seconds() < self.refresh_seconds:
+        mono = time.monotonic()
+        if self._last_fetch_mono is not None and mono - self._last_fetch_mono < self.refresh_seconds:
             return
 
+        now = dt.datetime.now(self.client.timezone)
+
         try:
             today = now.date()
             tomorrow = today + dt.timedelta(days=1)
             tasks = self.client.get_open_tasks_for_range(today, tomorrow)
-            grouped_today = [t for t in tasks if t.date == today]
-            grouped_tomorrow = [t for t in tasks if t.date == tomorrow]
+            # One pass over the tasks, bucketed by day.
+            grouped_today: List[TaskItem] = []
+            grouped_tomorrow: List[TaskItem] = []
+            buckets = {today: grouped_today, tomorrow: grouped_tomorrow}
+            for task in tasks:
+                bucket = buckets.get(task.date)
+                if bucket is not None:
+                    bucket.append(task)
 
             self.today_tasks = self._sorted_limited(grouped_today)
             self.tomorrow_tasks = self._sorted_limited(grouped_tomorrow)
             self.today_overflow = max(0, len(grouped_today) - len(self.today_tasks))
             self.tomorrow_overflow = max(0, len(grouped_tomorrow) - len(self.tomorrow_tasks))
+            self.today_lines = [self._format_task_line(t) for t in self.today_tasks]
+            self.tomorrow_lines = [self._format_task_line(t) for t in self.tomorrow_tasks]
             self.error_message = None
         except Exception as exc:  # pragma: no cover - defensive
             log.warning("TickTick update failed: %s", exc)
@@ -78,8 +97,11 @@ class Module(BaseDisplayModule):
             self.tomorrow_tasks = []
             self.today_overflow = 0
             self.tomorrow_overflow = 0
+            self.today_lines = []
+            self.tomorrow_lines = []
 
         self.last_fetch = now
+        self._last_fetch_mono = mono
 
     def handle_button(self, event: str) -> None:
         # No interactive actions yet.
@@ -94,9 +116,12 @@ class Module(BaseDisplayModule):
             return sorted_tasks[: self.max_items_per_day]
         return sorted_tasks
 
-    def _task_sort_key(self, task: TaskItem) -> Tuple[int, dt.time]:
-        time_val = (task.time.replace(tzinfo=None) if task.time else dt.time(23, 59, 59))
-        return (0 if task.time else 1, time_val)
+    def _task_sort_key(self, task: TaskItem) -> Tuple[int, int, int, int, int]:
+        # Plain ints: no naive time copy per task, and aware/naive times compare alike.
+        t = task.time
+        if t is None:
+            return (1, 23, 59, 59, 0)
+        return (0, t.hour, t.minute, t.second, t.microsecond)
 
     def _truncate_title(self, title: str) -> str:
         if len(title) <= self.title_max_length:
@@ -115,13 +140,12 @@ class Module(BaseDisplayModule):
         return f"{prefix} {title}"
 
     def _get_text_size(self, draw: ImageDraw.ImageDraw, text: str, font: Any) -> Tuple[int, int]:
-        try:
-            left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
-            return right - left, bottom - top
-        except AttributeError:  # pragma: no cover - fallback
-            return draw.textsize(text, font=font)
+        return measure_text(draw, text, font)
 
     def _wrap_text(self, draw: ImageDraw.ImageDraw, text: str, font: Any, max_width: int) -> List[str]:
+        if hasattr(font, "getlength"):
+            return wrap_text(text, font, max_width, break_long_words=True)
+        # Older Pillow: estimate characters per line from the width of "M".
         width_per_char = max(self._get_text_size(draw, "M", font)[0], 1)
         approx_chars = max_width // width_per_char
         wrapper = textwrap.TextWrapper(width=max(approx_chars, 1))
@@ -137,20 +161,44 @@ class Module(BaseDisplayModule):
         if self.last_fetch is None:
             self.tick()
 
-        image = Image.new("1", (width, height), 255)
-        draw = ImageDraw.Draw(image)
-
         if self.error_message:
-            self._draw_centered(draw, width, height, self.error_message)
+            image = Image.new("1", (width, height), 255)
+            self._draw_centered(ImageDraw.Draw(image), width, height, self.error_message)
             return image
 
+        chrome, sections = self._chrome_for(width, height)
+        image = chrome.copy()
+        draw = ImageDraw.Draw(image)
+
+        body_font = self.fonts.get("default")
+        small_font = self.fonts.get("small", body_font)
+        (today_box, today_top), (tomorrow_box, tomorrow_top) = sections
+        self._draw_section(draw, today_box, today_top, self.today_lines, self.today_overflow, body_font, small_font)
+        self._draw_section(
+            draw,
+            tomorrow_box,
+            tomorrow_top,
+            self.tomorrow_lines,
+            self.tomorrow_overflow,
+            body_font,
+            small_font,
+        )
+
+        return image
+
+    def _chrome_for(
+        self, width: int, height: int
+    ) -> Tuple[Image.Image, Tuple[Tuple[Tuple[int, int, int, int], int], ...]]:
+        """Both day cards with their headers, drawn once per size."""
+        cached = self._chrome.get((width, height))
+        if cached is not None:
+            return cached
+
         padding = OUTER_PAD
         column_gap = COL_GAP
         usable_width = width - (padding * 2) - column_gap
         column_width = usable_width // 2
         header_font = self.fonts.get("large", self.fonts.get("default"))
-        body_font = self.fonts.get("default")
-        small_font = self.fonts.get("small", body_font)
 
         today_box = (padding, padding, padding + column_width, height - padding)
         tomorrow_box = (
@@ -160,19 +208,16 @@ class Module(BaseDisplayModule):
             height - padding,
         )
 
-        self._draw_section(draw, today_box, "Today", self.today_tasks, self.today_overflow, header_font, body_font, small_font)
-        self._draw_section(
-            draw,
-            tomorrow_box,
-            "Tomorrow",
-            self.tomorrow_tasks,
-            self.tomorrow_overflow,
-            header_font,
-            body_font,
-            small_font,
-        )
+        chrome = Image.new("1", (width, height), 255)
+        draw = ImageDraw.Draw(chrome)
+        sections = []
+        for box, title in ((today_box, "Today"), (tomorrow_box, "Tomorrow")):
+            x0, y0, x1, y1 = box
+            draw_card(draw, x0, y0, x1, y1)
+            sections.append((box, draw_card_header(draw, x0, y0, x1, title, header_font)))
 
-        return image
+        cached = self._chrome[(width, height)] = (chrome, tuple(sections))
+        return cached
 
     def _draw_centered(self, draw: ImageDraw.ImageDraw, width: int, height: int, text: str) -> None:
         font = self.fonts.get("default")
@@ -183,31 +228,30 @@ class Module(BaseDisplayModule):
         self,
         draw: ImageDraw.ImageDraw,
         box: Tuple[int, int, int, int],
-        title: str,
-        tasks: List[TaskItem],
+        content_top: int,
+        lines: List[str],
         overflow: int,
-        header_font: Any,
         body_font: Any,
         small_font: Any,
     ) -> None:
+        """Draw one day's task lines below its (pre-drawn) card header."""
         x0, y0, x1, y1 = box
-        draw_card(draw, x0, y0, x1, y1)
-        content_top = draw_card_header(draw, x0, y0, x1, title, header_font)
         line_y = content_top + INNER_PAD // 2
         max_width = (x1 - x0) - INNER_PAD * 2
 
-        if not tasks:
+        if not lines:
             placeholder = "No tasks" if overflow == 0 else "Tasks hidden"
             draw.text((x0 + INNER_PAD, line_y), placeholder, font=body_font, fill=0)
             return
 
-        for task in tasks:
-            line = self._format_task_line(task)
+        # One pitch for every line: "Mg" spans cap height and descender, so
+        # lines without either (e.g. "xxxx") no longer pack tighter than the rest.
+        line_pitch = self._get_text_size(draw, "Mg", body_font)[1] + LINE_SPACING
+        for line in lines:
             wrapped = self._wrap_text(draw, line, body_font, max_width)
             for segment in wrapped:
                 draw.text((x0 + INNER_PAD, line_y), segment, font=body_font, fill=0)
-                _, lh = self._get_text_size(draw, segment, body_font)
-                line_y += lh + LINE_SPACING
+                line_y += line_pitch
                 if line_y >= y1 - 40:
                     break
             if line_y >= y1 - 40:
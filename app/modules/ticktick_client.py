@@ -2,21 +2,52 @@
 from __future__ import annotations
 
 import datetime as dt
+import json
 import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from typing import Any, Dict, List, Optional
 from zoneinfo import ZoneInfo
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 log = logging.getLogger(__name__)
 
+try:
+    from ciso8601 import parse_datetime as _ciso_parse  # type: ignore
+except ImportError:
+    # Optional speedup only; the stdlib path below parses the same strings.
+    _ciso_parse = None
+
+try:
+    import orjson  # type: ignore
+
+    _json_loads = orjson.loads
+except ImportError:
+    # Optional speedup only; the stdlib parser reads the same bytes.
+    _json_loads = json.loads
+
+# Project data requests issued at once; each is an independent GET.
+_MAX_PARALLEL_FETCHES = 8
+_UTC = dt.timezone.utc
+# ``status`` values TickTick uses for finished tasks.
+_DONE_STATUSES = frozenset({2, "completed", "done"})
+
 EXPIRED_MESSAGE = (
     "TickTick token expired. Please re-run dumb-smart-display/scripts $ python ticktick_oauth.py  to get a new access_token."
 )
 
 
-@dataclass
+# No per-task __dict__ where the interpreter supports it (3.10+).
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class TaskItem:
     """Normalized representation of a TickTick task."""
 
@@ -28,6 +59,45 @@ class TaskItem:
     is_completed: bool
 
 
+def _parse_iso(value: str) -> dt.datetime:
+    """Parse a TickTick timestamp; raises ValueError when it isn't ISO 8601."""
+    if _ciso_parse is not None:
+        try:
+            # C parser; reads "Z" and colon-less offsets like "+0000" natively.
+            return _ciso_parse(value.strip())
+        except ValueError:
+            pass
+
+    normalized = value.replace("Z", "+00:00").strip()
+    # TickTick returns offsets like "+0000" without a colon; add one so
+    # ``fromisoformat`` can understand it.
+    if len(normalized) >= 5 and normalized[-3] != ":" and normalized[-5] in {"+", "-"}:
+        normalized = f"{normalized[:-2]}:{normalized[-2:]}"
+    return dt.datetime.fromisoformat(normalized)
+
+
+def _to_zone(parsed: dt.datetime, zone: dt.tzinfo) -> dt.datetime:
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=_UTC)
+    return parsed.astimezone(zone)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_in_zone(value: str, zone: dt.tzinfo) -> Optional[dt.datetime]:
+    """Parse *value* and convert it to *zone*, memoized per raw string.
+
+    Due/start dates rarely change between polls, so repeat fetches are mostly
+    dict lookups. The returned datetimes are immutable and safe to share.
+    """
+    try:
+        parsed = _parse_iso(value)
+    except ValueError:
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("TickTickClient failed to parse datetime: %s", value)
+        return None
+    return _to_zone(parsed, zone)
+
+
 class TickTickClient:
     """Thin wrapper around TickTick's REST API."""
 
@@ -48,12 +118,38 @@ class TickTickClient:
         self.access_token_expires_at = self.config.get("access_token_expires_at")
 
         self._session = requests.Session()
+        self._session.headers["Accept"] = "application/json"
+        # Room for every concurrent project fetch on one kept-alive pool, and
+        # transient 429/5xx answers retried in place. Retry-After is not
+        # honoured: a long one would stall the module's tick.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=_MAX_PARALLEL_FETCHES,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+                respect_retry_after_header=False,
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         self._access_token: Optional[str] = None
-        self._token_expiry: Optional[dt.datetime] = None
+        # The configured expiry never changes, so it is parsed once up front.
+        expiry = self._parse_datetime(self.access_token_expires_at)
+        self._token_expiry: Optional[dt.datetime] = expiry.astimezone(_UTC) if expiry else None
 
         self._projects_cache: Dict[str, str] = {}
-        self._projects_cache_time: Optional[dt.datetime] = None
+        # time.monotonic() value after which the project list is refetched.
+        self._projects_cache_deadline = 0.0
+        # Conditional headers from the last full project list response.
+        self._projects_validators: Dict[str, str] = {}
         self._projects_ttl = int(self.config.get("projects_cache_seconds", 6 * 3600))
+        # Ask the server to trim project data to the requested dates. The Open
+        # API doesn't document these params, so it is opt-in; results are
+        # still filtered locally either way.
+        self._server_side_date_filter = bool(self.config.get("server_side_date_filter", False))
 
     # ------------------------------------------------------------------
     # HTTP helpers
@@ -61,30 +157,14 @@ class TickTickClient:
     def _parse_datetime(self, value: Any) -> Optional[dt.datetime]:
         if not value:
             return None
-        if isinstance(value, dt.datetime):
-            parsed = value
-        elif isinstance(value, str):
-            normalized = value.replace("Z", "+00:00").strip()
-            # TickTick returns offsets like "+0000" without a colon; add one so
-            # ``fromisoformat`` can understand it.
-            if len(normalized) >= 5 and normalized[-3] != ":" and normalized[-5] in {"+", "-"}:
-                normalized = f"{normalized[:-2]}:{normalized[-2:]}"
-
-            try:
-                parsed = dt.datetime.fromisoformat(normalized)
-            except ValueError:
-                log.debug("TickTickClient failed to parse datetime: %s", value)
-                return None
-        else:
+        if isinstance(value, str):
+            return _parse_iso_in_zone(value, self.timezone)
+        if not isinstance(value, dt.datetime):
             return None
-
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=dt.timezone.utc)
-        return parsed.astimezone(self.timezone)
+        return _to_zone(value, self.timezone)
 
     def _ensure_token(self) -> None:
-        now = dt.datetime.now(dt.timezone.utc)
-        if self._token_expiry and self._token_expiry <= now:
+        if self._token_expiry and self._token_expiry <= dt.datetime.now(_UTC):
             raise RuntimeError(EXPIRED_MESSAGE)
 
         if self._access_token:
@@ -94,24 +174,19 @@ class TickTickClient:
             raise RuntimeError("TickTick access_token is missing")
 
         self._access_token = self.access_token
-
-        if self.access_token_expires_at:
-            expiry = self._parse_datetime(self.access_token_expires_at)
-            if expiry:
-                self._token_expiry = expiry.astimezone(dt.timezone.utc)
-                if self._token_expiry <= now:
-                    raise RuntimeError(EXPIRED_MESSAGE)
+        # Set once on the session rather than merged into every request.
+        self._session.headers["Authorization"] = f"Bearer {self._access_token}"
 
     def _request(self, method: str, path: str, **kwargs: Any) -> Any:
-        self._ensure_token()
+        return _json_loads(self._send(method, path, **kwargs).content)
 
-        headers = kwargs.pop("headers", {})
-        headers["Authorization"] = f"Bearer {self._access_token}"
-        headers.setdefault("Accept", "application/json")
+    def _send(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        """Issue a request and return the raw response (any 2xx or 304)."""
+        self._ensure_token()
 
         url = f"{self.base_url}/{path.lstrip('/')}"
         try:
-            resp = self._session.request(method, url, headers=headers, timeout=10, **kwargs)
+            resp = self._session.request(method, url, timeout=10, **kwargs)
             resp.raise_for_status()
         except requests.HTTPError as err:
             status = err.response.status_code if err.response is not None else None
@@ -119,31 +194,44 @@ class TickTickClient:
                 raise RuntimeError(EXPIRED_MESSAGE) from err
             raise
 
-        return resp.json()
+        return resp
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
     def get_projects_map(self) -> Dict[str, str]:
-        now = dt.datetime.now(dt.timezone.utc)
-        if (
-            self._projects_cache
-            and self._projects_cache_time
-            and (now - self._projects_cache_time).total_seconds() < self._projects_ttl
-        ):
+        now = time.monotonic()
+        if self._projects_cache and now < self._projects_cache_deadline:
+            return self._projects_cache
+
+        # Revalidate instead of refetching: an unchanged list comes back as a
+        # bodiless 304 and the cached map is kept for another TTL.
+        headers = self._projects_validators if self._projects_cache else None
+        resp = self._send("GET", "project", headers=headers)
+        if resp.status_code == 304 and self._projects_cache:
+            self._projects_cache_deadline = now + self._projects_ttl
             return self._projects_cache
 
-        payload = self._request("GET", "project")
-        mapping = {}
+        payload = _json_loads(resp.content)
+        mapping: Dict[str, str] = {}
         if isinstance(payload, list):
-            for entry in payload:
-                pid = entry.get("id") or entry.get("_id")
-                if not pid:
-                    continue
-                mapping[str(pid)] = entry.get("name") or entry.get("title") or "Inbox"
+            mapping = {
+                str(pid): entry.get("name") or entry.get("title") or "Inbox"
+                for entry in payload
+                if isinstance(entry, dict) and (pid := entry.get("id") or entry.get("_id"))
+            }
+
+        validators = {}
+        etag = resp.headers.get("ETag")
+        if etag:
+            validators["If-None-Match"] = etag
+        last_modified = resp.headers.get("Last-Modified")
+        if last_modified:
+            validators["If-Modified-Since"] = last_modified
 
         self._projects_cache = mapping
-        self._projects_cache_time = now
+        self._projects_cache_deadline = now + self._projects_ttl
+        self._projects_validators = validators
         return mapping
 
     def get_open_tasks_for_range(self, start: dt.date, end: dt.date) -> List[TaskItem]:
@@ -152,9 +240,10 @@ class TickTickClient:
         project_lookup = self.get_projects_map()
         project_ids = self._project_ids_to_query(project_lookup)
         normalized: List[TaskItem] = []
+        normalize = self._normalize_task
 
-        for project_id in project_ids:
-            payload = self._request("GET", f"project/{project_id}/data")
+        params = {"from": start.isoformat(), "to": end.isoformat()} if self._server_side_date_filter else None
+        for project_id, payload in zip(project_ids, self._fetch_project_data(project_ids, params)):
             if not isinstance(payload, dict):
                 continue
 
@@ -166,20 +255,37 @@ class TickTickClient:
 
             tasks_list = payload.get("tasks")
             if not isinstance(tasks_list, list):
-                tasks_list = []
+                continue
 
-            for task in tasks_list:
-                if not isinstance(task, dict):
-                    continue
-                task.setdefault("projectId", project_id)
-                item = self._normalize_task(task, project_lookup)
-                if item is None or item.is_completed:
-                    continue
-                if start <= item.date <= end:
-                    normalized.append(item)
+            # Completed tasks are dropped before any date parsing.
+            items = (
+                normalize(task, project_lookup, project_id)
+                for task in tasks_list
+                if isinstance(task, dict) and not (task.get("isCompleted") or task.get("status") in _DONE_STATUSES)
+            )
+            normalized.extend(
+                item for item in items if item is not None and not item.is_completed and start <= item.date <= end
+            )
 
         return normalized
 
+    def _fetch_project_data(self, project_ids: List[str], params: Optional[Dict[str, str]] = None) -> List[Any]:
+        """GET every project's data, concurrently when there is more than one.
+
+        Total latency is the slowest request rather than the sum of them.
+        Results come back in ``project_ids`` order; the first failure raises.
+        """
+        paths = [f"project/{project_id}/data" for project_id in project_ids]
+        fetch = partial(self._request, "GET", params=params)
+        if len(paths) <= 1:
+            return [fetch(path) for path in paths]
+
+        # Resolve the token up front so the workers never race to set it.
+        self._ensure_token()
+        workers = min(_MAX_PARALLEL_FETCHES, len(paths))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ticktick") as pool:
+            return list(pool.map(fetch, paths))
+
     def _project_ids_to_query(self, project_lookup: Dict[str, str]) -> List[str]:
         configured = self.config.get("project_ids") or self.config.get("projects")
         if configured:
@@ -202,20 +308,23 @@ class TickTickClient:
     # ------------------------------------------------------------------
     # Normalization
     # ------------------------------------------------------------------
-    def _normalize_task(self, task: Dict[str, Any], project_lookup: Dict[str, str]) -> Optional[TaskItem]:
+    def _normalize_task(
+        self, task: Dict[str, Any], project_lookup: Dict[str, str], default_project_id: str = ""
+    ) -> Optional[TaskItem]:
         due_raw = task.get("dueDate") or task.get("due") or task.get("due_date")
         start_raw = task.get("startDate") or task.get("start")
 
-        due_dt = self._parse_datetime(due_raw)
-        start_dt = self._parse_datetime(start_raw)
+        parse = self._parse_datetime
+        due_dt = parse(due_raw)
+        start_dt = parse(start_raw)
         anchor = due_dt or start_dt
 
         if anchor is None:
             return None
 
         is_all_day = bool(task.get("isAllDay")) or (anchor.hour == 0 and anchor.minute == 0 and anchor.second == 0)
-        is_completed = bool(task.get("isCompleted")) or task.get("status") in {2, "completed", "done"}
-        project_id = str(task.get("projectId") or task.get("project_id") or "")
+        is_completed = bool(task.get("isCompleted")) or task.get("status") in _DONE_STATUSES
+        project_id = str(task.get("projectId") or task.get("project_id") or default_project_id)
         project_name = project_lookup.get(project_id, "")
 
         time_part: Optional[dt.time] = None
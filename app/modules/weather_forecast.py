@@ -14,7 +14,7 @@ from app.core.module_interface import BaseDisplayModule, DEFAULT_LAYOUTS, Layout
 from app.core.theme import (
     PAGE_HEADER_H, PAGE_HEADER_RX, PAGE_HEADER_RY, PAGE_HEADER_RADIUS,
     DIVIDER_W, COL_GAP, LINE_SPACING,
-    draw_page_header, fit_header_font, get_text_size as _theme_get_text_size,
+    draw_page_header, fit_header_font, load_font, get_text_size as _theme_get_text_size,
 )
 
 log = logging.getLogger(__name__)
@@ -282,7 +282,7 @@ class Module(BaseDisplayModule):
     def _load_font(self, size: int) -> Any:
         path = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
         try:
-            return ImageFont.truetype(path, size)
+            return load_font(path, size)
         except Exception:
             return self.fonts.get("default")
 
@@ -318,7 +318,7 @@ class Module(BaseDisplayModule):
         # Probe from large → small in steps of 2 px
         for size in range(60, 18, -2):
             try:
-                f = ImageFont.truetype(bold_path, size)
+                f = load_font(bold_path, size)
             except Exception:
                 f = self.fonts.get("default")
             dummy = Image.new("1", (1, 1))
@@ -121,6 +121,22 @@ HARDWARE_SCHEMA: SectionSchema = {
             "min": 100000,
             "placeholder": "4000000",
         },
+        {
+            "key": "min_refresh_seconds",
+            "label": "Minimum Refresh Interval (seconds)",
+            "type": "number",
+            "help": "Advanced. Shortest gap between two panel updates. Rapid button presses are held back this long to protect the panel.",
+            "min": 0,
+            "placeholder": "2",
+        },
+        {
+            "key": "sleep_after_seconds",
+            "label": "Panel Sleep Delay (seconds)",
+            "type": "number",
+            "help": "Advanced. How long the panel stays awake after an update before it is put to sleep. Quick successive updates reuse the awake panel.",
+            "min": 0,
+            "placeholder": "3",
+        },
         {
             "key": "simulate",
             "label": "Simulator Mode",